@@ -1,2 +1,14 @@
+from assistant.budget import Budget
+from assistant.bus import Bus
 from assistant.interface import AP, Interface, Station
-from assistant.monitor import monitor, watch
+from assistant.journal import Journal
+from assistant.leases import Leases
+from assistant.logger import Console, File, Logger, Ring, logger
+from assistant.metrics import Histogram, Metrics, metrics
+from assistant.monitor import monitor, scan, watch
+from assistant.quarantine import Quarantine
+from assistant.radio import Radio, radio
+from assistant.roaming import Roaming
+from assistant.schedule import Schedule
+from assistant.store import Store
+from assistant.trace import Recorder, Replay
@@ -0,0 +1,73 @@
+from time import ticks_diff, ticks_ms
+
+from assistant.radio import RSSI
+
+
+class Budget:
+    """
+    Time limit for a whole 'watch' cycle, shared among the candidate stations with 'reserve' kept for the fallback
+    """
+
+    def __init__(self, cycle: int = 60, minimum: int = 2, reserve: int = 15) -> None:
+        if minimum <= 0:
+            raise ValueError("'minimum' must be positive and greater than 0")
+
+        if reserve <= 0:
+            raise ValueError("'reserve' must be positive and greater than 0")
+
+        if cycle < minimum + reserve:
+            raise ValueError("'cycle' must be at least 'minimum' plus 'reserve'")
+
+        self._cycle: int = cycle
+        # SSID -> consecutive failed joins, which shrink the share of a station
+        self._failures: dict[str, int] = {}
+        self._minimum: int = minimum
+        self._reference: int = ticks_ms()
+        self._reserve: int = reserve
+
+    @property
+    def cycle(self) -> int:
+        return self._cycle
+
+    @property
+    def minimum(self) -> int:
+        return self._minimum
+
+    @property
+    def reserve(self) -> int:
+        return self._reserve
+
+    def _weight(self, candidate: tuple) -> float:
+        station, network = candidate
+        return max(1, network[RSSI] + 100) / (1 + self._failures.get(station.ssid, 0))
+
+    def allot(self, candidates: list[tuple], position: int) -> float:
+        # Candidates later in the list keep a share proportional to their signal and history.
+        available: float = self.left() - self._reserve
+
+        if available < self._minimum:
+            return 0
+
+        total: float = 0
+        for candidate in candidates[position:]:
+            total += self._weight(candidate)
+
+        share: float = available * self._weight(candidates[position]) / total
+
+        return min(max(share, self._minimum), available)
+
+    def bound(self, timeout: float) -> float:
+        # The fallback may use what the stations left, and at least the reserve.
+        return min(timeout, max(self.left(), self._reserve))
+
+    def left(self) -> float:
+        return self._cycle - ticks_diff(ticks_ms(), self._reference) / 1000
+
+    def record(self, ssid: str, joined: bool) -> None:
+        if joined:
+            self._failures.pop(ssid, None)
+        else:
+            self._failures[ssid] = self._failures.get(ssid, 0) + 1
+
+    def start(self) -> None:
+        self._reference = ticks_ms()
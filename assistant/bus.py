@@ -0,0 +1,148 @@
+from time import ticks_diff, ticks_ms
+
+from asyncio import CancelledError, Event, create_task
+
+from assistant.journal import CALLBACK, Journal
+from assistant.logger import ERROR, logger
+from assistant.metrics import metrics
+
+# Events published by 'watch'
+CONNECTED: int = 0
+DISCONNECTED: int = 1
+LOST: int = 2
+
+# What 'publish' does when the queue is full
+DROP_NEWEST: int = 0
+DROP_OLDEST: int = 1
+
+
+class Bus:
+    """
+    Bounded queue delivering events to subscribers from its own task, in the order they were published
+    """
+
+    def __init__(
+        self, capacity: int = 8, journal: Journal = None, overflow: int = DROP_OLDEST
+    ) -> None:
+        if capacity <= 0:
+            raise ValueError("'capacity' must be positive and greater than 0")
+
+        if overflow not in (DROP_NEWEST, DROP_OLDEST):
+            raise ValueError(
+                f"'overflow' must be either DROP_NEWEST ({DROP_NEWEST}) or DROP_OLDEST ({DROP_OLDEST})"
+            )
+
+        self._dropped: int = 0
+        self._errors: int = 0
+        self._head: int = 0
+        self._journal: Journal = journal
+        self._overflow: int = overflow
+        self._pending: int = 0
+        self._ready: Event = Event()
+        self._subscribers: tuple[list, list, list] = ([], [], [])
+        self._task = None
+        # Preallocated like the journal's, so publishing never allocates
+        self._events: bytearray = bytearray(capacity)
+        self._interfaces: list = [None] * capacity
+        self._values: list[int] = [None] * capacity
+
+    @property
+    def dropped(self) -> int:
+        return self._dropped
+
+    @property
+    def errors(self) -> int:
+        return self._errors
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    async def _deliver(self, callback, interface, value: int) -> None:
+        reference: int = ticks_ms()
+
+        try:
+            if value is None:
+                await callback(interface)
+            else:
+                await callback(interface, value)
+        except CancelledError:
+            raise
+        except Exception as exception:
+            # A failing subscriber must not stop delivery to the others, and without a sink it is printed.
+            self._errors += 1
+            logger.log(
+                level=ERROR,
+                message=f"Callback {callback} raised {exception!r}",
+                verbose=not logger.sinks,
+            )
+
+        duration: int = ticks_diff(ticks_ms(), reference)
+        metrics.callbacks.observe(duration)
+        if self._journal:
+            self._journal.record(
+                kind=CALLBACK,
+                subject=interface.ssid if interface else None,
+                value=duration,
+            )
+
+    async def _run(self) -> None:
+        capacity: int = len(self._events)
+
+        while True:
+            while not self._pending:
+                self._ready.clear()
+                await self._ready.wait()
+
+            slot: int = self._head
+            event: int = self._events[slot]
+            interface = self._interfaces[slot]
+            value: int = self._values[slot]
+            self._interfaces[slot] = None
+            self._head = (slot + 1) % capacity
+            self._pending -= 1
+
+            for callback in tuple(self._subscribers[event]):
+                await self._deliver(callback=callback, interface=interface, value=value)
+
+    def publish(self, event: int, interface, value: int = None) -> bool:
+        capacity: int = len(self._events)
+
+        if self._pending == capacity:
+            self._dropped += 1
+            if self._overflow == DROP_NEWEST:
+                return False
+            self._head = (self._head + 1) % capacity
+            self._pending -= 1
+
+        slot: int = (self._head + self._pending) % capacity
+        self._events[slot] = event
+        self._interfaces[slot] = interface
+        self._values[slot] = value
+        self._pending += 1
+        self._ready.set()
+
+        return True
+
+    def start(self) -> bool:
+        if self._task is not None:
+            return False
+        self._task = create_task(self._run())
+        return True
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def subscribe(self, event: int, callback) -> None:
+        if callback not in self._subscribers[event]:
+            self._subscribers[event].append(callback)
+
+    def unsubscribe(self, event: int, callback) -> None:
+        if callback in self._subscribers[event]:
+            self._subscribers[event].remove(callback)
@@ -1,3 +1,5 @@
+from binascii import hexlify
+from random import randint
 from time import ticks_diff, ticks_ms
 
 from asyncio import get_event_loop, sleep
@@ -11,6 +13,29 @@ from network import (
     WLAN,
 )
 
+from assistant.leases import Leases
+from assistant.logger import DEBUG, INFO, WARNING, logger
+from assistant.metrics import metrics
+from assistant.radio import JOIN, radio
+
+# Built once so '_attempt' allocates nothing per poll when logging is disabled
+_STATUSES: dict[int, str] = {
+    STAT_CONNECT_FAIL: f"Connection Failed ({STAT_CONNECT_FAIL})",
+    STAT_CONNECTING: f"Connecting ({STAT_CONNECTING})",
+    STAT_GOT_IP: f"Got IP ({STAT_GOT_IP})",
+    STAT_IDLE: f"Idle ({STAT_IDLE})",
+    STAT_NO_AP_FOUND: f"No AP found ({STAT_NO_AP_FOUND})",
+    STAT_WRONG_PASSWORD: f"Wrong Password ({STAT_WRONG_PASSWORD})",
+}
+
+# Power profiles, from the lowest latency to the lowest power draw
+LOW_LATENCY: int = 0
+BALANCED: int = 1
+LOW_POWER: int = 2
+
+# Power management mode of each profile
+_MODES: tuple[int] = (WLAN.PM_NONE, WLAN.PM_PERFORMANCE, WLAN.PM_POWERSAVE)
+
 
 class Interface:
     """
@@ -27,9 +52,13 @@ class Interface:
             )
 
         self._interface: int = interface
+        self._outcome: int = None
         self._password: str = password
+        self._polling: tuple[int, int] = (50, 1000)
+        # None leaves the firmware default untouched
+        self._profile: int = None
         self._ssid: str = ssid
-        self._wlan: WLAN = WLAN(interface)
+        self._wlan: WLAN = radio.wlan(interface)
 
         if interface == WLAN.IF_AP:
             if password:
@@ -41,16 +70,31 @@ class Interface:
 
     @property
     def alive(self) -> bool:
+        # WLAN objects are shared per interface, so only the Interface that last joined owns the link.
+        if radio.owner(self.interface) not in (None, self):
+            return False
         return self.wlan.status() == STAT_GOT_IP
 
     @property
     def interface(self) -> int:
         return self._interface
 
+    @property
+    def outcome(self) -> int:
+        return self._outcome
+
     @property
     def password(self) -> str:
         return self._password
 
+    @property
+    def polling(self) -> tuple[int, int]:
+        return self._polling
+
+    @property
+    def profile(self) -> int:
+        return self._profile
+
     @property
     def ssid(self) -> str:
         return self._ssid
@@ -66,68 +110,122 @@ class Interface:
         if type(verbose) is not bool:
             raise TypeError(f"'verbose' must be {bool} and not {type(verbose)}")
 
-        if self.wlan.status() == STAT_GOT_IP:
+        if self.alive:
             return True
 
+        # Concurrent attempts on this Interface share one, and other radio work waits for it.
+        return await radio.perform(
+            key=self,
+            operation=lambda: self._attempting(timeout=timeout, verbose=verbose),
+            priority=JOIN,
+        )
+
+    async def _attempting(self, timeout: int, verbose: bool) -> bool:
         delta: int = 0
-        pause: int = 1
+        minimum, maximum = self.polling
+        pause: int = minimum
+        previous: int = None
         reference: int = ticks_ms()
-        statuses: dict = {
-            STAT_CONNECT_FAIL: f"Connection Failed ({STAT_CONNECT_FAIL})",
-            STAT_CONNECTING: f"Connecting ({STAT_CONNECTING})",
-            STAT_GOT_IP: f"Got IP ({STAT_GOT_IP})",
-            STAT_IDLE: f"Idle ({STAT_IDLE})",
-            STAT_NO_AP_FOUND: f"No AP found ({STAT_NO_AP_FOUND})",
-            STAT_WRONG_PASSWORD: f"Wrong Password ({STAT_WRONG_PASSWORD})",
-        }
         timeout *= 1000
         wlan: WLAN = self.wlan
 
         wlan.active(True)
+        radio.claim(interface=self.interface, owner=self)
 
         if self.interface == WLAN.IF_STA and wlan.status() != STAT_IDLE:
-            wlan.connect(self.ssid, self.password)
+            self._connect()
 
         while delta < timeout:
             status: int = wlan.status()
+            self._outcome = status
 
-            if verbose:
-                description: str = statuses.get(status, f"Unknown Status ({status})")
-                print(
-                    f"WLAN {wlan}",
-                    f"Counter: {delta} ms, Status: {description}",
-                    sep=f"\n{' ' * 2}",
+            # Poll quickly after every status change and back off while the status holds.
+            if status != previous:
+                pause = minimum
+                previous = status
+            else:
+                pause = min(pause + max(1, pause // 4), maximum)
+
+            if logger.enabled(level=DEBUG, verbose=verbose):
+                description: str = _STATUSES.get(status, f"Unknown Status ({status})")
+                logger.log(
+                    level=DEBUG,
+                    message=f"WLAN {wlan}\n{' ' * 2}Counter: {delta} ms, Status: {description}",
+                    verbose=verbose,
                 )
 
             if status == STAT_IDLE:
                 if self.interface == WLAN.IF_STA:
-                    wlan.connect(self.ssid, self.password)
-                await sleep(pause)
+                    self._connect()
+                await sleep(pause / 1000)
             elif status == STAT_CONNECTING:
-                await sleep(pause)
+                await sleep(pause / 1000)
             elif status == STAT_GOT_IP:
                 break
             elif status in (STAT_CONNECT_FAIL, STAT_NO_AP_FOUND, STAT_WRONG_PASSWORD):
                 wlan.active(False)
                 break
             else:
-                await sleep(pause)
+                await sleep(pause / 1000)
 
             delta = ticks_diff(ticks_ms(), reference)
 
-        if verbose and delta >= timeout:
-            print(f"Timeout reached!")
+        if delta >= timeout and logger.enabled(level=WARNING, verbose=verbose):
+            logger.log(level=WARNING, message="Timeout reached!", verbose=verbose)
+
+        connected: bool = wlan.status() == STAT_GOT_IP
 
-        return wlan.status() == STAT_GOT_IP
+        if connected:
+            # Powering the radio down restores the firmware default, so every new link gets the profile again.
+            self._apply()
+
+        if self.interface == WLAN.IF_STA:
+            if connected:
+                metrics.connects.observe(ticks_diff(ticks_ms(), reference))
+            else:
+                metrics.count_failure(self.outcome)
+
+        return connected
+
+    def _apply(self) -> None:
+        if self._profile is not None:
+            self.wlan.config(pm=_MODES[self._profile])
+
+    def _connect(self) -> None:
+        self.wlan.connect(self.ssid, self.password)
 
     def deactivate(self) -> None:
         self.disconnect()
         self.wlan.active(False)
 
     def disconnect(self) -> None:
-        if self.wlan.status() == STAT_GOT_IP:
+        if self.alive:
             self.wlan.disconnect()
 
+    def pace(self, minimum: int = 50, maximum: int = 1000) -> None:
+        if minimum <= 0:
+            raise ValueError("'minimum' must be positive and greater than 0")
+
+        if maximum < minimum:
+            raise ValueError("'maximum' must be greater than or equal to 'minimum'")
+
+        self._polling = (minimum, maximum)
+
+    def tune(self, profile: int = BALANCED) -> None:
+        if type(profile) is not int:
+            raise TypeError(f"'profile' must be {int} not {type(profile)}")
+
+        if profile not in (LOW_LATENCY, BALANCED, LOW_POWER):
+            raise ValueError(
+                f"'profile' must be either LOW_LATENCY ({LOW_LATENCY}), BALANCED ({BALANCED}) or LOW_POWER ({LOW_POWER})"
+            )
+
+        self._profile = profile
+
+        # Switching at runtime only touches a link this Interface owns.
+        if self.wlan.active() and radio.owner(self.interface) in (None, self):
+            self._apply()
+
 
 class AP(Interface):
     """
@@ -151,29 +249,189 @@ class Station(Interface):
     STA WLAN Interface
     """
 
-    def __init__(self, password: str, ssid: str):
+    # Statuses that another attempt cannot fix, so 'aconnect' stops retrying on them
+    _fatal: tuple[int] = (STAT_WRONG_PASSWORD,)
+
+    # Whether a cached lease is configured on the STA interface, which every Station shares
+    _static: bool = False
+
+    def __init__(
+        self,
+        password: str,
+        ssid: str,
+        bssid: bytes = None,
+        channel: int = None,
+        leases: Leases = None,
+    ):
         super().__init__(interface=WLAN.IF_STA, password=password, ssid=ssid)
+        self._bssid: bytes = bssid
+        self._channel: int = channel
+        self._encoded: bytes = ssid.encode()
+        # Whether the last connect used a cached lease, or None once its outcome was handled
+        self._leased: bool = None
+        self._leases: Leases = leases
+
+    @property
+    def bssid(self) -> bytes:
+        return self._bssid
+
+    @property
+    def channel(self) -> int:
+        return self._channel
+
+    @property
+    def encoded(self) -> bytes:
+        return self._encoded
+
+    @property
+    def leases(self) -> Leases:
+        return self._leases
+
+    @property
+    def rssi(self) -> int:
+        return self.wlan.status("rssi")
+
+    def _connect(self) -> None:
+        config: tuple = None
+        self._leased = None
+
+        # Leases are kept per BSSID, so a join left to the firmware's choice of access point asks DHCP.
+        if self._leases is not None and self.bssid is not None:
+            config = self._leases.lookup(ssid=self.ssid, bssid=self.bssid)
+            self._leased = config is not None
+
+        if Station._static and config is None:
+            # Restarting the interface brings DHCP back, as asking for it before association can block.
+            self.wlan.active(False)
+            self.wlan.active(True)
+            Station._static = False
+
+        if self.bssid is None:
+            super()._connect()
+        elif self.channel is None:
+            self.wlan.connect(self.ssid, self.password, bssid=self.bssid)
+        else:
+            self.wlan.connect(
+                self.ssid, self.password, bssid=self.bssid, channel=self.channel
+            )
+
+        # Applied once the connect is under way, so the link comes up without waiting for DHCP.
+        if config is not None:
+            self.wlan.ifconfig(config)
+            Station._static = True
 
     async def aconnect(
-        self, retries: int = 0, timeout: int = 15, verbose: bool = False
+        self,
+        retries: int = 0,
+        timeout: int = 15,
+        verbose: bool = False,
+        backoff: int = 500,
+        deadline: int = None,
     ) -> bool:
         if retries < 0:
             raise ValueError("Retries must be positive and greater than 0")
 
-        connected: bool = await self._attempt(timeout=timeout, verbose=verbose)
+        if backoff < 0:
+            raise ValueError("'backoff' must be positive")
 
-        if not connected and retries > 0:
-            if verbose:
-                print(f"Retry {retries - (retries - 1)}/{retries}")
-            return await self.aconnect(
-                retries=retries - 1, timeout=timeout, verbose=verbose
-            )
-        else:
-            return connected
+        attempt: int = 0
+        reference: int = ticks_ms()
+        self._leased = None
+
+        while True:
+            limit: float = timeout
+
+            if deadline is not None:
+                limit = min(
+                    timeout, deadline - ticks_diff(ticks_ms(), reference) / 1000
+                )
+                if limit <= 0:
+                    if logger.enabled(level=WARNING, verbose=verbose):
+                        logger.log(
+                            level=WARNING,
+                            message=f"Deadline of {deadline}s reached!",
+                            verbose=verbose,
+                        )
+                    return False
+
+            if await self._attempt(timeout=limit, verbose=verbose):
+                if self._leased is False:
+                    self._leases.save(
+                        bssid=self.bssid, config=self.wlan.ifconfig(), ssid=self.ssid
+                    )
+                self._leased = None
+                return True
+
+            if self.outcome in self._fatal:
+                if logger.enabled(level=WARNING, verbose=verbose):
+                    logger.log(
+                        level=WARNING,
+                        message=f"Status {self.outcome} will not recover, giving up",
+                        verbose=verbose,
+                    )
+                return False
+
+            if self._leased:
+                # The cached configuration may be stale, so the next try asks DHCP.
+                if logger.enabled(level=INFO, verbose=verbose):
+                    logger.log(
+                        level=INFO,
+                        message=f"Lease for {self.ssid} failed, asking DHCP",
+                        verbose=verbose,
+                    )
+                self._leases.forget(ssid=self.ssid)
+                self._leased = None
+                continue
+
+            if self.bssid is not None:
+                if logger.enabled(level=INFO, verbose=verbose):
+                    logger.log(
+                        level=INFO,
+                        message=f"BSSID {hexlify(self.bssid).decode()} failed, trying any BSSID",
+                        verbose=verbose,
+                    )
+                self.pin()
+                continue
+
+            if attempt >= retries:
+                return False
+
+            attempt += 1
+            # Exponential backoff with jitter keeps a fleet from retrying in lockstep.
+            delay: int = min(backoff << (attempt - 1), 30000)
+            delay = randint(delay // 2, delay) if delay else 0
+
+            if deadline is not None:
+                remaining: int = deadline * 1000 - ticks_diff(ticks_ms(), reference)
+                delay = max(0, min(delay, remaining))
+
+            if logger.enabled(level=INFO, verbose=verbose):
+                logger.log(
+                    level=INFO,
+                    message=f"Retry {attempt}/{retries} in {delay} ms",
+                    verbose=verbose,
+                )
+
+            await sleep(delay / 1000)
 
     def connect(
-        self, retries: int = 0, timeout: int = 15, verbose: bool = False
+        self,
+        retries: int = 0,
+        timeout: int = 15,
+        verbose: bool = False,
+        backoff: int = 500,
+        deadline: int = None,
     ) -> bool:
         return get_event_loop().run_until_complete(
-            self.aconnect(retries=retries, timeout=timeout, verbose=verbose)
+            self.aconnect(
+                backoff=backoff,
+                deadline=deadline,
+                retries=retries,
+                timeout=timeout,
+                verbose=verbose,
+            )
         )
+
+    def pin(self, bssid: bytes = None, channel: int = None) -> None:
+        self._bssid = bssid
+        self._channel = channel
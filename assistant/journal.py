@@ -0,0 +1,107 @@
+from array import array
+from time import ticks_diff, ticks_ms
+
+# Kinds of connectivity events
+CALLBACK: int = 0
+FAILED: int = 1
+FALLBACK: int = 2
+JOINED: int = 3
+JOINING: int = 4
+LOST: int = 5
+ROAMED: int = 6
+SCANNED: int = 7
+
+_KINDS: tuple[str] = (
+    "callback",
+    "failed",
+    "fallback",
+    "joined",
+    "joining",
+    "lost",
+    "roamed",
+    "scanned",
+)
+
+
+class Journal:
+    """
+    Connectivity history kept in a fixed number of preallocated slots and optionally flushed to a file
+    """
+
+    def __init__(self, capacity: int = 64, batch: int = 16, path: str = None) -> None:
+        if capacity <= 0:
+            raise ValueError("'capacity' must be positive and greater than 0")
+
+        if batch <= 0:
+            raise ValueError("'batch' must be positive and greater than 0")
+
+        # Flushing later than every 'capacity' events would lose events to the ring.
+        self._batch: int = min(batch, capacity)
+        self._count: int = 0
+        self._flushed: int = 0
+        self._path: str = path
+        # Parallel slots, so recording an event only overwrites what is already allocated
+        self._kinds: bytearray = bytearray(capacity)
+        self._subjects: list[str] = [None] * capacity
+        self._ticks: array = array("q", [0]) * capacity
+        self._values: array = array("i", [0]) * capacity
+
+    @property
+    def capacity(self) -> int:
+        return len(self._kinds)
+
+    @property
+    def events(self) -> list[tuple[int, str, str, int]]:
+        return [self._event(_) for _ in range(self._oldest(), self._count)]
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def _event(self, position: int) -> tuple[int, str, str, int]:
+        slot: int = position % self.capacity
+        return (
+            self._ticks[slot],
+            _KINDS[self._kinds[slot]],
+            self._subjects[slot],
+            self._values[slot],
+        )
+
+    def _oldest(self) -> int:
+        return self._count - min(self._count, self.capacity)
+
+    def clear(self) -> None:
+        self._count = 0
+        self._flushed = 0
+
+    def flush(self) -> None:
+        # Events overwritten before a flush are lost rather than stalling 'record'.
+        start: int = max(self._flushed, self._oldest())
+
+        if self._path is None or start == self._count:
+            return
+
+        with open(self._path, "a") as file:
+            for position in range(start, self._count):
+                ticks, kind, subject, value = self._event(position)
+                file.write(f"{ticks} {kind} {subject} {value}\n")
+
+        self._flushed = self._count
+
+    def record(self, kind: int, subject: str = None, value: int = 0) -> None:
+        slot: int = self._count % self.capacity
+        self._kinds[slot] = kind
+        self._subjects[slot] = subject
+        self._ticks[slot] = ticks_ms()
+        self._values[slot] = value
+        self._count += 1
+
+        if self._path is not None and self._count - self._flushed >= self._batch:
+            self.flush()
+
+    def since(self, ticks: int) -> list[tuple[int, str, str, int]]:
+        return [
+            self._event(_)
+            for _ in range(self._oldest(), self._count)
+            if ticks_diff(self._ticks[_ % self.capacity], ticks) >= 0
+        ]
@@ -0,0 +1,66 @@
+from binascii import hexlify
+from json import dump, load
+from time import time
+
+
+class Leases:
+    """
+    IP configurations from past DHCP joins, kept per access point so a rejoin to it can skip DHCP
+    """
+
+    def __init__(self, lifetime: int = 3600, path: str = None) -> None:
+        if lifetime <= 0:
+            raise ValueError("'lifetime' must be positive and greater than 0")
+
+        # Key -> [ifconfig, seconds since the epoch when it was obtained]
+        self._entries: dict[str, list] = {}
+        self._lifetime: int = lifetime
+        self._path: str = path
+
+        if path is not None:
+            try:
+                with open(path) as file:
+                    self._entries = load(file)
+            except (OSError, ValueError):
+                # A missing or unreadable file only means every join asks DHCP first.
+                self._entries = {}
+
+    @property
+    def lifetime(self) -> int:
+        return self._lifetime
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def _key(self, ssid: str, bssid: bytes) -> str:
+        return f"{ssid}@{hexlify(bssid).decode()}"
+
+    def _persist(self) -> None:
+        if self._path is not None:
+            with open(self._path, "w") as file:
+                dump(self._entries, file)
+
+    def forget(self, ssid: str = None) -> None:
+        if ssid is None:
+            self._entries.clear()
+        else:
+            for key in [_ for _ in self._entries if _.startswith(f"{ssid}@")]:
+                del self._entries[key]
+        self._persist()
+
+    def lookup(self, ssid: str, bssid: bytes) -> tuple | None:
+        # Access points sharing an SSID may sit on different subnets, and a lease applied to the
+        # wrong one still lets the join succeed, so only the BSSID that handed it out reuses it.
+        if (entry := self._entries.get(self._key(ssid, bssid))) is None:
+            return None
+
+        # A clock that went backwards, as after a reboot without NTP, cannot vouch for the lease.
+        if 0 <= int(time()) - entry[1] <= self._lifetime:
+            return tuple(entry[0])
+
+        return None
+
+    def save(self, ssid: str, config: tuple, bssid: bytes) -> None:
+        self._entries[self._key(ssid, bssid)] = [list(config), int(time())]
+        self._persist()
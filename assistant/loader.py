@@ -0,0 +1,58 @@
+from json import loads
+
+
+def credentials(stream, limit: int = 512, size: int = 64):
+    # Yields (ssid, password, options) for every object of a JSON array read 'size' characters at a time,
+    # so only one object is ever held in memory. Objects without an SSID are skipped.
+    if limit <= 0:
+        raise ValueError("'limit' must be positive and greater than 0")
+
+    if size <= 0:
+        raise ValueError("'size' must be positive and greater than 0")
+
+    depth: int = 0
+    escaped: bool = False
+    length: int = 0
+    parts: list[str] = []
+    quoted: bool = False
+
+    while chunk := stream.read(size):
+        if type(chunk) is not str:
+            # Bytes would split UTF-8 characters between chunks, so only text streams are read.
+            raise TypeError(f"'stream' must be opened in text mode, read {type(chunk)}")
+
+        start: int = 0
+
+        for position, character in enumerate(chunk):
+            if not depth:
+                if character == "{":
+                    depth = 1
+                    start = position
+                continue
+
+            if quoted:
+                if escaped:
+                    escaped = False
+                elif character == "\\":
+                    escaped = True
+                elif character == '"':
+                    quoted = False
+            elif character == '"':
+                quoted = True
+            elif character in "{[":
+                depth += 1
+            elif character in "}]":
+                depth -= 1
+                if not depth:
+                    parts.append(chunk[start : position + 1])
+                    entry: dict = loads("".join(parts))
+                    parts.clear()
+                    length = 0
+                    if (ssid := entry.pop("ssid", None)) is not None:
+                        yield ssid, entry.pop("password", ""), entry
+
+        if depth:
+            parts.append(chunk[start:])
+            length += len(chunk) - start
+            if length > limit:
+                raise ValueError(f"Entry is longer than {limit} characters")
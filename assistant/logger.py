@@ -0,0 +1,125 @@
+from time import ticks_ms
+
+DEBUG: int = 10
+INFO: int = 20
+WARNING: int = 30
+ERROR: int = 40
+
+_NAMES: dict[int, str] = {
+    DEBUG: "DEBUG",
+    INFO: "INFO",
+    WARNING: "WARNING",
+    ERROR: "ERROR",
+}
+
+
+class Console:
+    """
+    Sink printing messages to the console
+    """
+
+    def write(self, level: int, message: str) -> None:
+        print(message)
+
+
+class File:
+    """
+    Sink appending messages to a file in batches to limit flash writes
+    """
+
+    def __init__(self, path: str, batch: int = 16) -> None:
+        if batch <= 0:
+            raise ValueError("'batch' must be positive and greater than 0")
+
+        self._batch: int = batch
+        self._pending: list[str] = []
+        self._path: str = path
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def flush(self) -> None:
+        if self._pending:
+            with open(self._path, "a") as file:
+                for line in self._pending:
+                    file.write(line)
+            self._pending.clear()
+
+    def write(self, level: int, message: str) -> None:
+        self._pending.append(f"{ticks_ms()} {_NAMES.get(level, level)} {message}\n")
+        if len(self._pending) >= self._batch:
+            self.flush()
+
+
+class Ring:
+    """
+    Sink keeping the latest messages in a fixed number of preallocated slots
+    """
+
+    def __init__(self, capacity: int = 32) -> None:
+        if capacity <= 0:
+            raise ValueError("'capacity' must be positive and greater than 0")
+
+        self._count: int = 0
+        self._slots: list = [None] * capacity
+
+    @property
+    def lines(self) -> list[str]:
+        capacity: int = len(self._slots)
+        start: int = self._count - min(self._count, capacity)
+        return [self._slots[_ % capacity] for _ in range(start, self._count)]
+
+    def clear(self) -> None:
+        self._count = 0
+
+    def write(self, level: int, message: str) -> None:
+        self._slots[self._count % len(self._slots)] = (
+            f"{ticks_ms()} {_NAMES.get(level, level)} {message}"
+        )
+        self._count += 1
+
+
+class Logger:
+    """
+    Leveled logging to pluggable sinks, where callers check 'enabled' before formatting a message
+    """
+
+    def __init__(self, level: int = INFO) -> None:
+        self._level: int = level
+        self._sinks: list = []
+
+    @property
+    def level(self) -> int:
+        return self._level
+
+    @level.setter
+    def level(self, level: int) -> None:
+        self._level = level
+
+    @property
+    def sinks(self) -> tuple:
+        return tuple(self._sinks)
+
+    def attach(self, sink: Console | File | Ring) -> None:
+        if sink not in self._sinks:
+            self._sinks.append(sink)
+
+    def detach(self, sink: Console | File | Ring) -> None:
+        if sink in self._sinks:
+            self._sinks.remove(sink)
+
+    def enabled(self, level: int, verbose: bool = False) -> bool:
+        return verbose or (level >= self._level and len(self._sinks) > 0)
+
+    def log(self, level: int, message: str, verbose: bool = False) -> None:
+        # 'verbose' keeps the behaviour of printing everything regardless of level or sinks.
+        if verbose:
+            print(message)
+        if level >= self._level:
+            for sink in self._sinks:
+                if not (verbose and isinstance(sink, Console)):
+                    sink.write(level, message)
+
+
+logger: Logger = Logger()
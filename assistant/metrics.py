@@ -0,0 +1,172 @@
+from array import array
+
+
+class Histogram:
+    """
+    Observations counted into fixed buckets, where the last bucket collects everything above 'bounds'
+    """
+
+    def __init__(self, bounds: tuple[int]) -> None:
+        if not bounds or list(bounds) != sorted(bounds):
+            raise ValueError("'bounds' must be ascending and not empty")
+
+        self._bounds: tuple[int] = tuple(bounds)
+        self._counts: array = array("I", [0]) * (len(bounds) + 1)
+        self._count: int = 0
+        self._maximum: int = 0
+        self._total: int = 0
+
+    @property
+    def bounds(self) -> tuple[int]:
+        return self._bounds
+
+    @property
+    def buckets(self) -> list[tuple[int, int]]:
+        # The overflow bucket is keyed by None as it has no upper bound.
+        return list(zip(self._bounds + (None,), self._counts))
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def maximum(self) -> int:
+        return self._maximum
+
+    @property
+    def mean(self) -> float:
+        return self._total / self._count if self._count else 0
+
+    def observe(self, value: int) -> None:
+        bucket: int = 0
+        for bound in self._bounds:
+            if value <= bound:
+                break
+            bucket += 1
+
+        self._counts[bucket] += 1
+        self._count += 1
+        self._maximum = max(self._maximum, value)
+        self._total += value
+
+    def percentile(self, fraction: float) -> int:
+        if not 0 < fraction <= 1:
+            raise ValueError("'fraction' must be greater than 0 and at most 1")
+
+        if not self._count:
+            return None
+
+        # Upper bound of the bucket holding the percentile, capped by the largest observation.
+        seen: int = 0
+        for bucket, count in enumerate(self._counts):
+            seen += count
+            if seen >= fraction * self._count:
+                break
+
+        if bucket < len(self._bounds):
+            return min(self._bounds[bucket], self._maximum)
+        return self._maximum
+
+    def reset(self) -> None:
+        for bucket in range(len(self._counts)):
+            self._counts[bucket] = 0
+        self._count = 0
+        self._maximum = 0
+        self._total = 0
+
+
+class Metrics:
+    """
+    Counters and latency histograms in ms describing how joins, scans and link checks perform
+    """
+
+    def __init__(self) -> None:
+        self._callbacks: Histogram = Histogram(bounds=(10, 50, 100, 500, 1000, 5000))
+        self._connects: Histogram = Histogram(
+            bounds=(250, 500, 1000, 2000, 4000, 8000, 15000)
+        )
+        self._detections: Histogram = Histogram(
+            bounds=(50, 100, 250, 500, 1000, 5000, 30000)
+        )
+        self._failures: dict[int, int] = {}
+        self._fallbacks: int = 0
+        self._roams: int = 0
+        self._scans: Histogram = Histogram(bounds=(250, 500, 1000, 2000, 3000, 5000))
+
+    @property
+    def callbacks(self) -> Histogram:
+        return self._callbacks
+
+    @property
+    def connects(self) -> Histogram:
+        return self._connects
+
+    @property
+    def detections(self) -> Histogram:
+        return self._detections
+
+    @property
+    def failures(self) -> dict[int, int]:
+        return self._failures
+
+    @property
+    def fallbacks(self) -> int:
+        return self._fallbacks
+
+    @property
+    def joins(self) -> int:
+        return self._connects.count
+
+    @property
+    def roams(self) -> int:
+        return self._roams
+
+    @property
+    def scans(self) -> Histogram:
+        return self._scans
+
+    def count_failure(self, status: int) -> None:
+        self._failures[status] = self._failures.get(status, 0) + 1
+
+    def count_fallback(self) -> None:
+        self._fallbacks += 1
+
+    def count_roam(self) -> None:
+        self._roams += 1
+
+    def reset(self) -> None:
+        for histogram in (
+            self._callbacks,
+            self._connects,
+            self._detections,
+            self._scans,
+        ):
+            histogram.reset()
+        self._failures.clear()
+        self._fallbacks = 0
+        self._roams = 0
+
+    def summary(self) -> dict:
+        summary: dict = {
+            "failures": dict(self._failures),
+            "fallbacks": self._fallbacks,
+            "joins": self.joins,
+            "roams": self._roams,
+        }
+        for name, histogram in (
+            ("callbacks", self._callbacks),
+            ("connects", self._connects),
+            ("detections", self._detections),
+            ("scans", self._scans),
+        ):
+            # (count, median, 90th percentile, maximum) in ms
+            summary[name] = (
+                histogram.count,
+                histogram.percentile(0.5),
+                histogram.percentile(0.9),
+                histogram.maximum,
+            )
+        return summary
+
+
+metrics: Metrics = Metrics()
@@ -1,14 +1,44 @@
 from binascii import hexlify
 from random import randint
+from time import ticks_diff, ticks_ms
 
-from asyncio import sleep
+from asyncio import CancelledError, TimeoutError, sleep
 from collections import namedtuple
 from network import WLAN
 
+from assistant.budget import Budget
+from assistant.bus import CONNECTED, DISCONNECTED, LOST as LINK_LOST, Bus
 from assistant.interface import AP, Interface, Station
+from assistant.journal import (
+    FAILED,
+    FALLBACK,
+    JOINED,
+    JOINING,
+    LOST,
+    ROAMED,
+    SCANNED,
+    Journal,
+)
+from assistant.logger import DEBUG, INFO, WARNING, logger
+from assistant.metrics import metrics
+from assistant.quarantine import Quarantine
+from assistant.radio import BSSID, CHANNEL, RSSI, SCAN, SSID, radio
+from assistant.roaming import Roaming
+from assistant.schedule import Schedule
+from assistant.store import Store
+
+try:
+    from _thread import allocate_lock, start_new_thread
+except ImportError:
+    start_new_thread = None
 
 ConnectedCallback: str = "Coroutine[[Interface | None], None]"
 DisconnectedCallback: str = "Coroutine[[Interface | None], None]"
+LostCallback: str = "Coroutine[[Interface, int], None]"
+
+
+def _rssi(network: tuple) -> int:
+    return network[RSSI]
 
 
 # NOTE - Case sensitivity matters when trying to connect to a network.
@@ -19,22 +49,86 @@ class _Monitor:
 
     _Scanned = namedtuple("_Scanned", "ssid bssid channel rssi security hidden")
 
+    # Results of the last radio scan, shared by every caller of '_scan'
+    _decoded: list[_Scanned] = None
+    _devices: list[tuple] = None
+    _matched: list[tuple] = []
+    _scanned: int = 0
+
+    @classmethod
+    def _callback(cls, bus: Bus, joined: Interface, left: Interface) -> None:
+        # Publishing in this order is what delivers a disconnect before the matching connect.
+        bus.publish(event=DISCONNECTED, interface=left) if left else None
+        bus.publish(event=CONNECTED, interface=joined) if joined else None
+
     @classmethod
-    async def _callback(
+    def _enlist(
         cls,
-        joined: Interface,
-        left: Interface,
-        connectedCallback: ConnectedCallback = None,
-        disconnectedCallback: DisconnectedCallback = None,
+        devices: list[tuple],
+        index: dict[bytes, list[int]],
+        stations: list[Station],
+        store: Store,
     ) -> None:
-        await disconnectedCallback(left) if disconnectedCallback and left else None
-        await connectedCallback(joined) if connectedCallback and joined else None
+        # Stored networks only become Stations once a scan shows them.
+        for device in devices:
+            if device[SSID] not in index and device[SSID] in store:
+                index[device[SSID]] = [len(stations)]
+                stations.append(store.station(device[SSID]))
+
+    @classmethod
+    async def _fallback(
+        cls,
+        active: AP | None | Station,
+        bus: Bus,
+        fallback: AP | None,
+        retries: int,
+        timeout: int,
+        journal: Journal = None,
+        verbose: bool = False,
+    ) -> AP | None | Station:
+        if await cls._join(
+            network=fallback,
+            retries=retries,
+            timeout=timeout,
+            verbose=verbose,
+        ):
+            if logger.enabled(level=INFO, verbose=verbose):
+                await cls._log(
+                    level=INFO,
+                    message=f"{'Configured AP' if active != fallback else 'Watching AP'} {fallback.ssid} {fallback.wlan}",
+                    verbose=verbose,
+                )
+
+            if active != fallback:
+                metrics.count_fallback()
+                if journal:
+                    journal.record(kind=FALLBACK, subject=fallback.ssid)
+                await cls._leave(network=active)
+                cls._callback(bus=bus, joined=fallback, left=active)
+                return fallback
+
+        return active
+
+    @classmethod
+    def _healthy(
+        cls,
+        active: AP | None | Station,
+        interval: int,
+        scanned: int,
+        threshold: int = None,
+    ) -> bool:
+        if not interval or not isinstance(active, Station) or not active.alive:
+            return False
+        if ticks_diff(ticks_ms(), scanned) >= interval * 1000:
+            return False
+        return threshold is None or active.rssi >= threshold
 
     @classmethod
     async def _join(
         cls,
         network: AP | None | Station,
         timeout: int,
+        deadline: float = None,
         retries: int = 0,
         verbose: bool = False,
     ) -> bool:
@@ -43,7 +137,7 @@ class _Monitor:
                 return await network.aconfigure(timeout=timeout, verbose=verbose)
             else:
                 return await network.aconnect(
-                    retries=retries, timeout=timeout, verbose=verbose
+                    deadline=deadline, retries=retries, timeout=timeout, verbose=verbose
                 )
         else:
             return False
@@ -57,37 +151,155 @@ class _Monitor:
                 network.disconnect()
 
     @classmethod
-    async def _log(cls, message: str, verbose: bool = False) -> bool:
-        if verbose:
-            print(message)
+    async def _log(cls, level: int, message: str, verbose: bool = False) -> None:
+        # Callers check 'logger.enabled' first, so disabled messages are never formatted.
+        logger.log(level=level, message=message, verbose=verbose)
+
+    @classmethod
+    def _match(cls, devices: list[tuple], known: dict[bytes, list]) -> list[tuple]:
+        # Truncating in place keeps the list's capacity, so steady-state cycles reuse it.
+        matched: list[tuple] = cls._matched
+        del matched[:]
+        for device in devices:
+            if device[SSID] in known:
+                matched.append(device)
+        return matched
 
     @classmethod
-    async def _scan(cls, decode: bool = False) -> list[cls._Scanned]:
-        scanner: WLAN = WLAN(WLAN.IF_STA)
+    async def _probe(cls, timeout: int = None) -> list[tuple]:
+        reference: int = ticks_ms()
+        scanner: WLAN = radio.wlan(WLAN.IF_STA)
         active: bool = scanner.active()
         if not active:
             scanner.active(True)
-        available: list[cls._Scanned] = [
-            cls._Scanned(*device) for device in scanner.scan()
-        ]
-        if decode:
-            transformation = lambda device: cls._Scanned(
-                ssid=device.ssid.decode() if decode else device.ssid,
-                bssid=(hexlify(device.bssid).decode() if decode else device.bssid),
-                channel=device.channel,
-                rssi=device.rssi,
-                security=device.security,
-                hidden=device.hidden,
+        lock = allocate_lock() if start_new_thread else None
+        results: list = []
+        if lock:
+            lock.acquire()
+            try:
+                start_new_thread(cls._scanning, (lock, results, scanner))
+            except OSError:
+                # The thread of the previous scan may not have exited yet, as rp2 only has core1 for it.
+                lock = None
+        if lock:
+            # Scanning blocks until the radio is done, so it runs on another thread while
+            # the event loop polls for completion.
+            pause: int = 1
+            try:
+                while not lock.acquire(0):
+                    if timeout and ticks_diff(ticks_ms(), reference) >= timeout * 1000:
+                        raise TimeoutError(
+                            f"Scan did not finish within {timeout} seconds"
+                        )
+                    await sleep(pause / 1000)
+                    pause = min(pause * 2, 50)
+            except (CancelledError, TimeoutError):
+                # The radio stays held until the abandoned scan is done, so nothing else starts on it.
+                radio.defer(cls._reap(active=active, lock=lock, scanner=scanner))
+                raise
+            if isinstance(results[0], Exception):
+                raise results[0]
+            devices: list[tuple] = results[0]
+        else:
+            devices: list[tuple] = scanner.scan()
+        if not active:
+            scanner.active(False)
+        metrics.scans.observe(ticks_diff(ticks_ms(), reference))
+        return devices
+
+    @classmethod
+    def _rank(
+        cls,
+        index: dict[bytes, list[int]],
+        networks: list[tuple],
+        roam: bool,
+        stations: list[Station],
+        roaming: Roaming = None,
+    ) -> list[tuple]:
+        # Each station appears once, paired with the strongest BSSID advertising its SSID.
+        best: dict[int, tuple] = {}
+        strength = roaming.strength if roam and roaming else _rssi
+        for network in networks:
+            for position in index[network[SSID]]:
+                if position not in best or strength(network) > strength(best[position]):
+                    best[position] = network
+
+        positions: list[int] = sorted(
+            best, key=(lambda _: (-strength(best[_]), _)) if roam else None
+        )
+
+        return [(stations[position], best[position]) for position in positions]
+
+    @classmethod
+    async def _scan(
+        cls, age: int = 0, decode: bool = False, timeout: int = None
+    ) -> list[_Scanned]:
+        fresh: bool = (
+            cls._devices is not None
+            and ticks_diff(ticks_ms(), cls._scanned) < age * 1000
+        )
+
+        if not fresh:
+            # Callers arriving while a scan is in flight share it through the radio.
+            devices: list[tuple] = await radio.perform(
+                key=cls._probe,
+                operation=lambda: cls._probe(timeout=timeout),
+                priority=SCAN,
             )
-            available = list(map(transformation, available))
+            if devices is not cls._devices:
+                cls._decoded = None
+                cls._devices = devices
+                cls._scanned = ticks_ms()
+
+        if not decode:
+            return cls._devices
+
+        if cls._decoded is None:
+            cls._decoded = [
+                cls._Scanned(
+                    device[SSID].decode(),
+                    hexlify(device[BSSID]).decode(),
+                    *device[2:],
+                )
+                for device in cls._devices
+            ]
+
+        return cls._decoded
+
+    @classmethod
+    async def _reap(cls, active: bool, lock, scanner: WLAN) -> None:
+        while not lock.acquire(0):
+            await sleep(0.05)
         if not active:
             scanner.active(False)
-        return available
+
+    @classmethod
+    def _scanning(cls, lock, results: list, scanner: WLAN) -> None:
+        try:
+            results.append(scanner.scan())
+        except Exception as exception:
+            results.append(exception)
+        finally:
+            lock.release()
 
     @classmethod
     async def _stall(cls, seconds: int) -> None:
         await sleep(seconds)
 
+    @classmethod
+    async def _watchdog(cls, interface: Interface, period: int, seconds: int) -> int:
+        deadline: int = seconds * 1000
+        reference: int = ticks_ms()
+        seen: int = reference
+
+        while (elapsed := ticks_diff(ticks_ms(), reference)) < deadline:
+            await sleep(min(period, deadline - elapsed) / 1000)
+            if not interface.alive:
+                return ticks_diff(ticks_ms(), seen)
+            seen = ticks_ms()
+
+        return -1
+
     @classmethod
     async def monitor(
         cls,
@@ -99,20 +311,48 @@ class _Monitor:
         retries: int = 0,
         timeout: int = 15,
         verbose: bool = False,
+        age: int = 0,
+        budget: Budget = None,
+        bus: Bus = None,
+        handover: bool = False,
+        interval: int = 0,
+        journal: Journal = None,
+        lostCallback: LostCallback = None,
+        quarantine: Quarantine = None,
+        scanning: int = 10,
+        schedule: Schedule = None,
+        threshold: int = None,
+        watchdog: int = 0,
     ) -> None:
         return await cls.watch(
+            age=age,
+            budget=budget,
+            bus=bus,
             connectedCallback=connectedCallback,
             disconnectedCallback=disconnectedCallback,
             fallback=fallback,
+            handover=handover,
+            interval=interval,
+            journal=journal,
+            lostCallback=lostCallback,
             pause=pause,
+            quarantine=quarantine,
             stations=[station],
             verbose=verbose,
             retries=retries,
+            scanning=scanning,
+            schedule=schedule,
+            threshold=threshold,
             timeout=timeout,
+            watchdog=watchdog,
         )
 
-    # NOTE - WLAN instances seem to work as singletons, which means if you try to configure
-    #        an AP/STA twice, it might reference the first instance.
+    @classmethod
+    async def scan(cls, age: int = 0, timeout: int = 10) -> list[_Scanned]:
+        return await cls._scan(age=age, decode=True, timeout=timeout)
+
+    # NOTE - WLAN instances seem to work as singletons, so every WLAN comes from 'radio',
+    #        which also keeps scans and joins from interleaving on the same radio.
     @classmethod
     async def watch(
         cls,
@@ -125,99 +365,316 @@ class _Monitor:
         retries: int = 0,
         timeout: int = 15,
         verbose: bool = False,
+        age: int = 0,
+        budget: Budget = None,
+        bus: Bus = None,
+        handover: bool = False,
+        interval: int = 0,
+        journal: Journal = None,
+        lostCallback: LostCallback = None,
+        quarantine: Quarantine = None,
+        roaming: Roaming = None,
+        scanning: int = 10,
+        schedule: Schedule = None,
+        store: Store = None,
+        threshold: int = None,
+        watchdog: int = 0,
     ):
-        if (_ := WLAN(WLAN.IF_AP)).active():
+        if (_ := radio.wlan(WLAN.IF_AP)).active():
             _.disconnect()
             _.active(False)
 
-        if (_ := WLAN(WLAN.IF_STA)).active():
+        if (_ := radio.wlan(WLAN.IF_STA)).active():
             _.disconnect()
             _.active(False)
 
         active: Interface = None
+        index: dict[bytes, list[int]] = {}
+        scanned: int = ticks_ms()
+        stations = list(stations)
 
-        while True:
-            networks: list[cls._Scanned] = await cls._scan(decode=True)
-
-            if roam:
-                networks.sort(key=lambda _: _.rssi, reverse=True)
-                reachable: list[Station] = [
-                    station
-                    for network in networks
-                    for station in stations
-                    if network.ssid == station.ssid
-                ]
-            else:
-                reachable: list[Station] = [
-                    station
-                    for station in stations
-                    for network in networks
-                    if network.ssid == station.ssid
-                ]
-
-            await cls._log(
-                message=f"Networks: {[(network.ssid, network.rssi) for network in networks]}",
-                verbose=verbose,
-            )
-            await cls._log(
-                message=f"Reachable: {[station.ssid for station in reachable]}",
-                verbose=verbose,
-            )
-            await cls._log(
-                message=f"Stations: {[station.ssid for station in stations]}",
-                verbose=verbose,
-            )
+        for position, station in enumerate(stations):
+            index.setdefault(station.encoded, []).append(position)
+
+        # Callbacks run on the bus task, so a slow callback never delays the next cycle.
+        bus = bus or Bus(journal=journal)
+        subscriptions: tuple = (
+            (CONNECTED, connectedCallback),
+            (DISCONNECTED, disconnectedCallback),
+            (LINK_LOST, lostCallback),
+        )
+        for event, callback in subscriptions:
+            bus.subscribe(event=event, callback=callback) if callback else None
+        started: bool = bus.start()
 
-            for station in reachable:
-                if await cls._join(
-                    network=station, retries=retries, timeout=timeout, verbose=verbose
+        try:
+            while True:
+                failed: bool = False
+                budget.start() if budget else None
+
+                if not roam and cls._healthy(
+                    active=active,
+                    interval=interval,
+                    scanned=scanned,
+                    threshold=threshold,
                 ):
-                    message: str = (
-                        f"{'Joined STA' if active != station else 'Watching STA'} {station.ssid} {station.wlan}"
+                    if logger.enabled(level=DEBUG, verbose=verbose):
+                        await cls._log(
+                            level=DEBUG,
+                            message=f"Watching STA {active.ssid} {active.wlan}",
+                            verbose=verbose,
+                        )
+                else:
+                    reference: int = ticks_ms()
+                    try:
+                        devices: list[tuple] = await cls._scan(
+                            age=age,
+                            timeout=(
+                                # The scan leaves the reserve to the fallback too.
+                                min(
+                                    scanning,
+                                    max(budget.left() - budget.reserve, budget.minimum),
+                                )
+                                if budget
+                                else scanning
+                            ),
+                        )
+                    except (OSError, TimeoutError) as error:
+                        if logger.enabled(level=WARNING, verbose=verbose):
+                            await cls._log(
+                                level=WARNING, message=f"{error}", verbose=verbose
+                            )
+                        await cls._stall(
+                            seconds=schedule.next(failed=True) if schedule else pause
+                        )
+                        continue
+
+                    if journal:
+                        journal.record(
+                            kind=SCANNED, value=ticks_diff(ticks_ms(), reference)
+                        )
+
+                    if store is not None:
+                        cls._enlist(
+                            devices=devices, index=index, stations=stations, store=store
+                        )
+
+                    networks: list[tuple] = cls._match(devices=devices, known=index)
+                    if roam and roaming:
+                        roaming.observe(networks=networks)
+
+                    reachable: list[tuple] = cls._rank(
+                        index=index,
+                        networks=networks,
+                        roam=roam,
+                        roaming=roaming,
+                        stations=stations,
                     )
+                    scanned = ticks_ms()
 
-                    await cls._log(
-                        message=message,
-                        verbose=verbose,
+                    # Joining another station drops the link of the active one, so while it is up it is only
+                    # left when roaming, and never because a scan missed its beacon.
+                    kept: bool = (
+                        isinstance(active, Station)
+                        and active.alive
+                        and (not roam or all(_[0] is not active for _ in reachable))
                     )
 
-                    if active != station:
-                        await cls._leave(network=active)
-                        await cls._callback(
-                            connectedCallback=connectedCallback,
-                            disconnectedCallback=disconnectedCallback,
-                            joined=station,
-                            left=active,
+                    if kept:
+                        reachable = []
+                    elif roam and roaming:
+                        reachable = roaming.hold(active=active, reachable=reachable)
+
+                    if logger.enabled(level=DEBUG, verbose=verbose):
+                        await cls._log(
+                            level=DEBUG,
+                            message=f"Networks: {[(network[SSID].decode(), network[RSSI]) for network in networks]} of {len(devices)}",
+                            verbose=verbose,
+                        )
+                        await cls._log(
+                            level=DEBUG,
+                            message=f"Reachable: {[station.ssid for station, _ in reachable]}",
+                            verbose=verbose,
+                        )
+                        await cls._log(
+                            level=DEBUG,
+                            message=f"Stations: {[station.ssid for station in stations]}",
+                            verbose=verbose,
                         )
-                        active = station
 
-                    break
-            else:
-                if await cls._join(
-                    network=fallback, retries=retries, timeout=timeout, verbose=verbose
-                ):
-                    message: str = (
-                        f"{'Configured AP' if active != fallback else 'Watching AP'} {fallback.ssid} {fallback.wlan}"
+                    if (
+                        handover
+                        and fallback
+                        and reachable
+                        and active is not fallback
+                        and not (active and active.alive)
+                    ):
+                        # Make before break, the AP serves clients while stations are attempted.
+                        active = await cls._fallback(
+                            active=active,
+                            bus=bus,
+                            fallback=fallback,
+                            journal=journal,
+                            retries=retries,
+                            timeout=(
+                                # Only the reserve, the rest of the cycle is for the stations.
+                                min(timeout, budget.reserve)
+                                if budget
+                                else timeout
+                            ),
+                            verbose=verbose,
+                        )
+
+                    for position, (station, network) in enumerate(reachable):
+                        if quarantine and quarantine.quarantined(station.ssid):
+                            if logger.enabled(level=DEBUG, verbose=verbose):
+                                await cls._log(
+                                    level=DEBUG,
+                                    message=f"Skipping STA {station.ssid}, quarantined for {quarantine.remaining(station.ssid)}s",
+                                    verbose=verbose,
+                                )
+                            continue
+
+                        limit: float = None
+                        if budget:
+                            limit = budget.allot(
+                                candidates=reachable, position=position
+                            )
+                            if not limit:
+                                # The rest of the cycle belongs to the fallback.
+                                if logger.enabled(level=DEBUG, verbose=verbose):
+                                    await cls._log(
+                                        level=DEBUG,
+                                        message=f"Skipping STA {station.ssid}, cycle budget spent",
+                                        verbose=verbose,
+                                    )
+                                continue
+
+                        station.pin(bssid=network[BSSID], channel=network[CHANNEL])
+                        # A station that is still up only gets checked, so it is not journaled as a join.
+                        joining: bool = journal is not None and not station.alive
+                        if joining:
+                            journal.record(kind=JOINING, subject=station.ssid)
+                            reference = ticks_ms()
+
+                        joined: bool = await cls._join(
+                            deadline=limit,
+                            network=station,
+                            retries=retries,
+                            timeout=timeout,
+                            verbose=verbose,
+                        )
+                        (
+                            budget.record(ssid=station.ssid, joined=joined)
+                            if budget
+                            else None
+                        )
+
+                        if joined:
+                            quarantine.release(station.ssid) if quarantine else None
+                            if joining:
+                                journal.record(
+                                    kind=JOINED,
+                                    subject=station.ssid,
+                                    value=ticks_diff(ticks_ms(), reference),
+                                )
+                            if active != station and isinstance(active, Station):
+                                metrics.count_roam()
+                                if journal:
+                                    journal.record(kind=ROAMED, subject=station.ssid)
+                            if logger.enabled(level=INFO, verbose=verbose):
+                                await cls._log(
+                                    level=INFO,
+                                    message=f"{'Joined STA' if active != station else 'Watching STA'} {station.ssid} {station.wlan}",
+                                    verbose=verbose,
+                                )
+
+                            if active != station:
+                                roaming.settle() if roaming else None
+                                await cls._leave(network=active)
+                                cls._callback(bus=bus, joined=station, left=active)
+                                active = station
+
+                            break
+
+                        failed = True
+                        if journal:
+                            journal.record(
+                                kind=FAILED,
+                                subject=station.ssid,
+                                value=station.outcome or 0,
+                            )
+
+                        if quarantine:
+                            cooldown: int = quarantine.fail(
+                                ssid=station.ssid, status=station.outcome
+                            )
+                            if logger.enabled(level=WARNING, verbose=verbose):
+                                await cls._log(
+                                    level=WARNING,
+                                    message=f"Quarantined STA {station.ssid} for {cooldown}s",
+                                    verbose=verbose,
+                                )
+                    else:
+                        if kept:
+                            if logger.enabled(level=DEBUG, verbose=verbose):
+                                await cls._log(
+                                    level=DEBUG,
+                                    message=f"Watching STA {active.ssid} {active.wlan}",
+                                    verbose=verbose,
+                                )
+                        else:
+                            active = await cls._fallback(
+                                active=active,
+                                bus=bus,
+                                fallback=fallback,
+                                journal=journal,
+                                retries=retries,
+                                timeout=budget.bound(timeout) if budget else timeout,
+                                verbose=verbose,
+                            )
+
+                seconds: float = pause
+                if schedule:
+                    up: bool = isinstance(active, Station) and active.alive
+                    seconds = schedule.next(
+                        failed=failed, rssi=active.rssi if up else None
                     )
+                    if logger.enabled(level=DEBUG, verbose=verbose):
+                        await cls._log(
+                            level=DEBUG, message=f"Pausing {seconds}s", verbose=verbose
+                        )
 
+                if watchdog and isinstance(active, Station) and active.alive:
+                    latency: int = await cls._watchdog(
+                        interface=active, period=watchdog, seconds=seconds
+                    )
+                    if latency >= 0:
+                        metrics.detections.observe(latency)
+                        if journal:
+                            journal.record(
+                                kind=LOST, subject=active.ssid, value=latency
+                            )
+                        if logger.enabled(level=WARNING, verbose=verbose):
+                            await cls._log(
+                                level=WARNING,
+                                message=f"Lost STA {active.ssid} within {latency} ms",
+                                verbose=verbose,
+                            )
+                        bus.publish(event=LINK_LOST, interface=active, value=latency)
+                else:
+                    await cls._stall(seconds=seconds)
+                if logger.enabled(level=DEBUG, verbose=verbose):
                     await cls._log(
-                        message=message,
-                        verbose=verbose,
+                        level=DEBUG, message="." * randint(1, 10), verbose=verbose
                     )
 
-                    if active != fallback:
-                        await cls._leave(network=active)
-                        await cls._callback(
-                            connectedCallback=connectedCallback,
-                            disconnectedCallback=disconnectedCallback,
-                            joined=fallback,
-                            left=active,
-                        )
-                        active = fallback
-
-            await cls._stall(seconds=pause)
-            await cls._log(message="." * randint(1, 10), verbose=verbose)
+        finally:
+            for event, callback in subscriptions:
+                bus.unsubscribe(event=event, callback=callback) if callback else None
+            bus.stop() if started else None
 
 
 monitor = _Monitor.monitor
+scan = _Monitor.scan
 watch = _Monitor.watch
@@ -0,0 +1,58 @@
+from time import ticks_diff, ticks_ms
+
+
+class Quarantine:
+    """
+    Failure tracking that skips repeatedly failing networks for an exponential cool-down
+    """
+
+    def __init__(self, base: int = 30, ceiling: int = 3600) -> None:
+        if base <= 0:
+            raise ValueError("'base' must be positive and greater than 0")
+
+        if ceiling < base:
+            raise ValueError("'ceiling' must be greater than or equal to 'base'")
+
+        self._base: int = base
+        self._ceiling: int = ceiling
+        # SSID -> [consecutive failures, last failure in ticks, cool-down in ms, last status]
+        self._entries: dict[str, list] = {}
+
+    @property
+    def networks(self) -> dict[str, tuple[int, int, int]]:
+        return {
+            ssid: (entry[0], self.remaining(ssid), entry[3])
+            for ssid, entry in self._entries.items()
+            if self.quarantined(ssid)
+        }
+
+    def fail(self, ssid: str, status: int = None) -> int:
+        entry: list = self._entries.get(ssid)
+
+        if entry is None:
+            entry = self._entries[ssid] = [0, 0, 0, None]
+
+        entry[0] += 1
+        cooldown: int = min(self._base << min(entry[0] - 1, 16), self._ceiling)
+        entry[1] = ticks_ms()
+        entry[2] = cooldown * 1000
+        entry[3] = status
+
+        return cooldown
+
+    def quarantined(self, ssid: str) -> bool:
+        return self.remaining(ssid) > 0
+
+    def release(self, ssid: str = None) -> None:
+        if ssid is None:
+            self._entries.clear()
+        elif ssid in self._entries:
+            del self._entries[ssid]
+
+    def remaining(self, ssid: str) -> int:
+        if (entry := self._entries.get(ssid)) is None:
+            return 0
+
+        left: int = entry[2] - ticks_diff(ticks_ms(), entry[1])
+
+        return (left + 999) // 1000 if left > 0 else 0
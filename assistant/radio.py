@@ -0,0 +1,122 @@
+from asyncio import CancelledError, Event, create_task
+from network import WLAN
+
+# Priorities of radio operations, where lower numbers go first
+JOIN: int = 0
+SCAN: int = 1
+
+# Positions within the raw tuples returned by WLAN.scan
+SSID: int = 0
+BSSID: int = 1
+CHANNEL: int = 2
+RSSI: int = 3
+
+
+class Radio:
+    """
+    Single owner of the WLAN interfaces, running one radio operation at a time by priority
+    """
+
+    def __init__(self) -> None:
+        self._busy: bool = False
+        # Work that keeps the radio busy once the current operation has returned
+        self._deferred = None
+        # Key -> [done, result, exception] for operations in progress
+        self._flights: dict = {}
+        self._owners: dict[int, object] = {}
+        self._sequence: int = 0
+        self._waiting: list[tuple] = []
+        self._wlans: dict[int, WLAN] = {}
+
+    @property
+    def busy(self) -> bool:
+        return self._busy
+
+    async def _acquire(self, priority: int) -> None:
+        if not self._busy:
+            self._busy = True
+            return
+
+        # The sequence number keeps operations of the same priority first come, first served.
+        entry: tuple = (priority, self._sequence, Event())
+        self._sequence += 1
+        self._waiting.append(entry)
+
+        try:
+            await entry[2].wait()
+        except CancelledError:
+            if entry in self._waiting:
+                self._waiting.remove(entry)
+            else:
+                self._release()
+            raise
+
+    async def _finish(self, deferred) -> None:
+        try:
+            await deferred
+        finally:
+            self._release()
+
+    def _release(self) -> None:
+        if self._waiting:
+            entry: tuple = min(self._waiting)
+            self._waiting.remove(entry)
+            # The radio is handed over without becoming idle, so nothing can jump the queue.
+            entry[2].set()
+        else:
+            self._busy = False
+
+    def defer(self, deferred) -> None:
+        # Called by an operation whose work outlives it, such as an abandoned scan still running on another thread.
+        self._deferred = deferred
+
+    def claim(self, interface: int, owner) -> None:
+        self._owners[interface] = owner
+
+    def owner(self, interface: int):
+        return self._owners.get(interface)
+
+    async def perform(self, key, operation, priority: int = SCAN):
+        # Callers asking for an operation already in progress share its outcome.
+        if (flight := self._flights.get(key)) is not None:
+            await flight[0].wait()
+            if flight[2] is None:
+                return flight[1]
+            if not isinstance(flight[2], CancelledError):
+                raise flight[2]
+            # The caller that started it was cancelled, so this one starts it again.
+            return await self.perform(key=key, operation=operation, priority=priority)
+
+        flight = self._flights[key] = [Event(), None, None]
+
+        try:
+            await self._acquire(priority=priority)
+            try:
+                flight[1] = await operation()
+            finally:
+                if (deferred := self._deferred) is not None:
+                    # Waiters stay queued until the deferred work is done.
+                    self._deferred = None
+                    create_task(self._finish(deferred))
+                else:
+                    self._release()
+        except (CancelledError, Exception) as exception:
+            flight[2] = exception
+            raise
+        finally:
+            del self._flights[key]
+            flight[0].set()
+
+        return flight[1]
+
+    def use(self, interface: int, wlan) -> None:
+        # Interfaces created afterwards get 'wlan', those created before keep the previous one.
+        self._wlans[interface] = wlan
+
+    def wlan(self, interface: int) -> WLAN:
+        if (wlan := self._wlans.get(interface)) is None:
+            wlan = self._wlans[interface] = WLAN(interface)
+        return wlan
+
+
+radio: Radio = Radio()
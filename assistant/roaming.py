@@ -0,0 +1,72 @@
+from time import ticks_diff, ticks_ms
+
+from assistant.interface import Interface, Station
+from assistant.radio import BSSID, RSSI
+
+
+class Roaming:
+    """
+    Smoothed RSSI with hysteresis and dwell time for deciding when 'watch' hands over between stations
+    """
+
+    def __init__(self, dwell: int = 60, margin: int = 8, weight: float = 0.3) -> None:
+        if dwell < 0:
+            raise ValueError("'dwell' must be positive")
+
+        if margin < 0:
+            raise ValueError("'margin' must be positive")
+
+        if not 0 < weight <= 1:
+            raise ValueError("'weight' must be greater than 0 and at most 1")
+
+        self._dwell: int = dwell
+        self._joined: int = ticks_ms()
+        self._margin: int = margin
+        self._smoothed: dict[bytes, float] = {}
+        self._weight: float = weight
+
+    @property
+    def smoothed(self) -> dict[bytes, float]:
+        return self._smoothed
+
+    def hold(self, active: Interface, reachable: list[tuple]) -> list[tuple]:
+        if not isinstance(active, Station) or not active.alive:
+            return reachable
+
+        for position, (station, network) in enumerate(reachable):
+            if station is active:
+                break
+        else:
+            return reachable
+
+        if position == 0:
+            return reachable
+
+        settled: bool = ticks_diff(ticks_ms(), self._joined) >= self._dwell * 1000
+        gain: float = self.strength(reachable[0][1]) - self.strength(network)
+
+        if not settled or gain < self._margin:
+            reachable.insert(0, reachable.pop(position))
+
+        return reachable
+
+    def observe(self, networks: list[tuple]) -> None:
+        # BSSIDs missing from the latest scan are forgotten rather than decayed.
+        previous: dict[bytes, float] = self._smoothed
+        self._smoothed = {}
+
+        for network in networks:
+            bssid: bytes = network[BSSID]
+            rssi: int = network[RSSI]
+            if bssid in previous:
+                self._smoothed[bssid] = previous[bssid] + self._weight * (
+                    rssi - previous[bssid]
+                )
+            else:
+                self._smoothed[bssid] = rssi
+
+    def settle(self) -> None:
+        self._joined = ticks_ms()
+
+    def strength(self, network: tuple) -> float:
+        return self._smoothed.get(network[BSSID], network[RSSI])
@@ -0,0 +1,56 @@
+class Schedule:
+    """
+    Pause between 'watch' cycles that grows while the link is strong and shrinks when it degrades
+    """
+
+    def __init__(
+        self,
+        drop: int = 3,
+        growth: float = 2,
+        maximum: int = 300,
+        minimum: int = 5,
+        strong: int = -67,
+    ) -> None:
+        if drop < 0:
+            raise ValueError("'drop' must be positive")
+
+        if growth < 1:
+            raise ValueError("'growth' must be at least 1")
+
+        if minimum <= 0:
+            raise ValueError("'minimum' must be positive and greater than 0")
+
+        if maximum < minimum:
+            raise ValueError("'maximum' must be greater than or equal to 'minimum'")
+
+        self._drop: int = drop
+        self._growth: float = growth
+        self._interval: float = minimum
+        self._maximum: int = maximum
+        self._minimum: int = minimum
+        self._rssi: int = None
+        self._strong: int = strong
+
+    @property
+    def interval(self) -> float:
+        return self._interval
+
+    def next(self, rssi: int = None, failed: bool = False) -> float:
+        # 'rssi' is None whenever no station is up, which includes running on the fallback AP.
+        previous: int = self._rssi
+        self._rssi = rssi
+
+        if failed or rssi is None:
+            self._interval = self._minimum
+        elif previous is not None and previous - rssi >= self._drop:
+            self._interval = self._minimum
+        elif rssi >= self._strong:
+            self._interval = min(self._interval * self._growth, self._maximum)
+        else:
+            self._interval = max(self._interval / self._growth, self._minimum)
+
+        return self._interval
+
+    def reset(self) -> None:
+        self._interval = self._minimum
+        self._rssi = None
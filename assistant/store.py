@@ -0,0 +1,163 @@
+from os import remove as unlink, rename
+
+from assistant.interface import Station
+from assistant.leases import Leases
+
+# Record flags, where removing a record only rewrites its flag
+_LIVE: int = 1
+_REMOVED: int = 0
+
+# Each record is a flag, the SSID length and the password length followed by both
+_HEADER: int = 3
+
+
+class Store:
+    """
+    Credentials kept on flash as length-prefixed records, indexed by SSID and turned into Stations only when needed
+    """
+
+    def __init__(self, leases: Leases = None, path: str = "networks.bin") -> None:
+        # SSID -> offset of its record
+        self._index: dict[bytes, int] = {}
+        self._leases: Leases = leases
+        self._path: str = path
+        self._size: int = 0
+        self._stations: dict[bytes, Station] = {}
+        self._waste: int = 0
+        self._load()
+
+    def __contains__(self, ssid: bytes) -> bool:
+        return ssid in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def ssids(self) -> list[str]:
+        return [ssid.decode() for ssid in self._index]
+
+    @property
+    def stations(self) -> list[Station]:
+        return list(self._stations.values())
+
+    @property
+    def waste(self) -> int:
+        return self._waste
+
+    def _erase(self, offset: int) -> None:
+        with open(self._path, "r+b") as file:
+            file.seek(offset)
+            header: bytes = file.read(_HEADER)
+            file.seek(offset)
+            file.write(bytes((_REMOVED,)))
+        self._waste += _HEADER + header[1] + header[2]
+
+    def _load(self) -> None:
+        self._index.clear()
+        self._size = 0
+        self._waste = 0
+
+        try:
+            file = open(self._path, "rb")
+        except OSError:
+            # A missing store is an empty one.
+            return
+
+        with file:
+            # Only headers and SSIDs are read, passwords stay on flash until a Station is needed.
+            while len(header := file.read(_HEADER)) == _HEADER:
+                ssid: bytes = file.read(header[1])
+                file.seek(header[2], 1)
+                length: int = _HEADER + header[1] + header[2]
+                if header[0] == _LIVE:
+                    self._index[ssid] = self._size
+                else:
+                    self._waste += length
+                self._size += length
+
+    def _read(self, offset: int) -> tuple[bytes, bytes]:
+        with open(self._path, "rb") as file:
+            file.seek(offset)
+            header: bytes = file.read(_HEADER)
+            return file.read(header[1]), file.read(header[2])
+
+    def _append(self, file, ssid: str, password: str) -> None:
+        encoded: bytes = ssid.encode()
+        secret: bytes = password.encode()
+
+        if not 0 < len(encoded) <= 32:
+            raise ValueError("'ssid' must be between 1 and 32 bytes long")
+
+        if len(secret) > 64:
+            raise ValueError("'password' must be at most 64 bytes long")
+
+        if encoded in self._index:
+            # The record may still sit in this file's buffer.
+            file.flush()
+            self._erase(self._index[encoded])
+
+        # Appending leaves every other record where it is, so adding never rewrites the file.
+        file.write(bytes((_LIVE, len(encoded), len(secret))))
+        file.write(encoded)
+        file.write(secret)
+
+        self._index[encoded] = self._size
+        self._size += _HEADER + len(encoded) + len(secret)
+        self._stations.pop(encoded, None)
+
+    def add(self, ssid: str, password: str) -> None:
+        with open(self._path, "ab") as file:
+            self._append(file=file, password=password, ssid=ssid)
+
+    def compact(self) -> None:
+        if not self._waste:
+            return
+
+        temporary: str = f"{self._path}.tmp"
+
+        with open(temporary, "wb") as file:
+            for offset in self._index.values():
+                ssid, secret = self._read(offset)
+                file.write(bytes((_LIVE, len(ssid), len(secret))))
+                file.write(ssid)
+                file.write(secret)
+
+        unlink(self._path)
+        rename(temporary, self._path)
+        self._load()
+
+    def remove(self, ssid: str) -> bool:
+        encoded: bytes = ssid.encode()
+
+        if (offset := self._index.pop(encoded, None)) is None:
+            return False
+
+        self._erase(offset)
+        self._stations.pop(encoded, None)
+
+        return True
+
+    def extend(self, entries) -> int:
+        # Takes (ssid, password, options) tuples such as those from 'loader.credentials'.
+        count: int = 0
+
+        with open(self._path, "ab") as file:
+            for ssid, password, options in entries:
+                self._append(file=file, password=password, ssid=ssid)
+                count += 1
+
+        return count
+
+    def password(self, ssid: bytes) -> str:
+        return self._read(self._index[ssid])[1].decode()
+
+    def station(self, ssid: bytes) -> Station:
+        if (station := self._stations.get(ssid)) is None:
+            station = self._stations[ssid] = Station(
+                leases=self._leases, password=self.password(ssid), ssid=ssid.decode()
+            )
+        return station
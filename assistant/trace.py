@@ -0,0 +1,293 @@
+from binascii import hexlify, unhexlify
+from json import dumps, loads
+from time import sleep, ticks_diff, ticks_ms
+
+from network import STAT_IDLE, WLAN
+
+from assistant.radio import radio
+
+# Calls after which the radio starts over, so a replay lines its timeline up with them
+_ANCHORS: tuple[str] = ("connect", "disconnect", "down", "up")
+
+# Answers for getters that were never recorded
+_DEFAULTS: dict[str, object] = {
+    "ifconfig": ("0.0.0.0", "0.0.0.0", "0.0.0.0", "0.0.0.0"),
+    "isconnected": False,
+    "rssi": 0,
+    "status": STAT_IDLE,
+}
+
+
+def _decode(devices: list) -> list[tuple]:
+    return [(unhexlify(_[0]), unhexlify(_[1]), *_[2:]) for _ in devices]
+
+
+def _encode(devices: list[tuple]) -> list[list]:
+    # SSIDs and BSSIDs are bytes, which JSON can only hold as text.
+    return [[hexlify(_[0]).decode(), hexlify(_[1]).decode(), *_[2:]] for _ in devices]
+
+
+class _Recording:
+    """
+    WLAN wrapper passing every call through to the radio and telling the Recorder what it answered
+    """
+
+    def __init__(self, interface: int, recorder, wlan: WLAN) -> None:
+        self._interface: int = interface
+        # Getter -> last answer, so polls that return the same status take no space
+        self._latest: dict[str, object] = {}
+        self._recorder = recorder
+        self._wlan: WLAN = wlan
+
+    def __repr__(self) -> str:
+        return repr(self._wlan)
+
+    def _answer(self, name: str, value):
+        if self._latest.get(name, self) != value:
+            self._latest[name] = value
+            self._recorder.record(interface=self._interface, name=name, value=value)
+        return value
+
+    def active(self, value: bool = None) -> bool | None:
+        if value is None:
+            return self._wlan.active()
+        self._wlan.active(value)
+        self._recorder.record(interface=self._interface, name="up" if value else "down")
+
+    def config(self, *args, **kwargs):
+        if args:
+            return self._answer(
+                name="rssi" if args[0] == "rssi" else f"config:{args[0]}",
+                value=self._wlan.config(*args),
+            )
+        # Settings are left out of the trace, as they include the password.
+        self._wlan.config(**kwargs)
+
+    def connect(self, ssid: str = None, key: str = None, **kwargs) -> None:
+        self._wlan.connect(ssid, key, **kwargs)
+        self._recorder.record(interface=self._interface, name="connect", value=ssid)
+
+    def disconnect(self) -> None:
+        self._wlan.disconnect()
+        self._recorder.record(interface=self._interface, name="disconnect")
+
+    def ifconfig(self, *args) -> tuple | None:
+        if args:
+            return self._wlan.ifconfig(*args)
+        return self._answer(name="ifconfig", value=self._wlan.ifconfig())
+
+    def isconnected(self) -> bool:
+        return self._answer(name="isconnected", value=self._wlan.isconnected())
+
+    def scan(self) -> list[tuple]:
+        reference: int = ticks_ms()
+        devices: list[tuple] = self._wlan.scan()
+        # Scans may run on another thread, so they never write to flash themselves.
+        self._recorder.record(
+            flush=False,
+            interface=self._interface,
+            name="scan",
+            value=[ticks_diff(ticks_ms(), reference), _encode(devices)],
+        )
+        return devices
+
+    def status(self, parameter: str = None) -> int:
+        if parameter is None:
+            return self._answer(name="status", value=self._wlan.status())
+        return self._answer(name=parameter, value=self._wlan.status(parameter))
+
+
+class Recorder:
+    """
+    Writer of a compact trace of what the radio answered to the WLAN calls made by assistant
+    """
+
+    def __init__(self, batch: int = 16, path: str = "trace.jsonl") -> None:
+        if batch <= 0:
+            raise ValueError("'batch' must be positive and greater than 0")
+
+        self._batch: int = batch
+        self._originals: dict[int, WLAN] = {}
+        self._path: str = path
+        self._pending: list[str] = []
+        self._reference: int = ticks_ms()
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def flush(self) -> None:
+        if self._pending:
+            with open(self._path, "a") as file:
+                for line in self._pending:
+                    file.write(line)
+            self._pending.clear()
+
+    def install(self) -> None:
+        # Interfaces created afterwards go through the recorder, so install it before creating them.
+        # Each install starts a new trace, as times count from it.
+        with open(self._path, "w"):
+            pass
+        self._pending.clear()
+        self._reference = ticks_ms()
+        for interface in (WLAN.IF_AP, WLAN.IF_STA):
+            wlan: WLAN = radio.wlan(interface)
+            self._originals[interface] = wlan
+            radio.use(
+                interface=interface,
+                wlan=_Recording(interface=interface, recorder=self, wlan=wlan),
+            )
+
+    def record(self, interface: int, name: str, flush: bool = True, value=None) -> None:
+        # Each line is [milliseconds since install, interface, call, answer].
+        self._pending.append(
+            f"{dumps([ticks_diff(ticks_ms(), self._reference), interface, name, value])}\n"
+        )
+        if flush and len(self._pending) >= self._batch:
+            self.flush()
+
+    def uninstall(self) -> None:
+        for interface, wlan in self._originals.items():
+            radio.use(interface=interface, wlan=wlan)
+        self._originals.clear()
+        self.flush()
+
+
+class _Replaying:
+    """
+    WLAN stand-in answering from the part of a trace recorded for one interface
+    """
+
+    def __init__(self, interface: int, records: list[list], speed: float) -> None:
+        self._active: bool = False
+        # Position of the anchor the replay is lined up with, or -1 before the first one
+        self._anchor: int = -1
+        self._config: dict[str, object] = {}
+        self._interface: int = interface
+        self._records: list[list] = records
+        self._reference: int = ticks_ms()
+        self._scans: int = 0
+        self._scanned: list[list] = [_[3] for _ in records if _[2] == "scan"]
+        self._speed: float = speed
+        self._start: int = 0
+
+    def __repr__(self) -> str:
+        return f"<Replay {'AP' if self._interface == WLAN.IF_AP else 'STA'} {self.status()}>"
+
+    def _align(self, name: str) -> None:
+        # The next call of the same kind in the trace becomes the new reference point.
+        for position in range(self._anchor + 1, len(self._records)):
+            if self._records[position][2] == name:
+                self._anchor = position
+                self._reference = ticks_ms()
+                self._start = self._records[position][0]
+                return
+
+    def _answer(self, name: str):
+        horizon: float = (
+            self._start + ticks_diff(ticks_ms(), self._reference) * self._speed
+        )
+        records: list[list] = self._records
+        end: int = len(records)
+
+        # Answers never come from beyond the next anchor, however long the replay waits.
+        for position in range(self._anchor + 1, end):
+            if records[position][2] in _ANCHORS:
+                end = position
+                break
+
+        for position in range(end - 1, -1, -1):
+            record: list = records[position]
+            if record[2] == name and record[0] <= horizon:
+                return record[3]
+
+        return _DEFAULTS.get(name)
+
+    def active(self, value: bool = None) -> bool | None:
+        if value is None:
+            return self._active
+        self._active = bool(value)
+        self._align(name="up" if value else "down")
+
+    def config(self, *args, **kwargs):
+        if not args:
+            self._config.update(kwargs)
+        elif args[0] == "rssi":
+            return self._answer(name="rssi")
+        elif args[0] in self._config:
+            return self._config[args[0]]
+        else:
+            return self._answer(name=f"config:{args[0]}")
+
+    def connect(self, ssid: str = None, key: str = None, **kwargs) -> None:
+        self._align(name="connect")
+
+    def disconnect(self) -> None:
+        self._align(name="disconnect")
+
+    def ifconfig(self, *args) -> tuple | None:
+        if not args:
+            return tuple(self._answer(name="ifconfig"))
+
+    def isconnected(self) -> bool:
+        return self._answer(name="isconnected")
+
+    def scan(self) -> list[tuple]:
+        if not self._scanned:
+            return []
+        # Scans come back in the recorded order, and the last one repeats once the trace runs out.
+        duration, devices = self._scanned[min(self._scans, len(self._scanned) - 1)]
+        self._scans += 1
+        sleep(duration / self._speed / 1000)
+        return _decode(devices)
+
+    def status(self, parameter: str = None) -> int:
+        return self._answer(name="status" if parameter is None else parameter)
+
+
+class Replay:
+    """
+    Radio stand-in answering the WLAN calls made by assistant from a recorded trace, 'speed' times faster
+    """
+
+    def __init__(self, path: str = "trace.jsonl", speed: float = 1) -> None:
+        if speed <= 0:
+            raise ValueError("'speed' must be positive and greater than 0")
+
+        self._originals: dict[int, WLAN] = {}
+        self._path: str = path
+        # Interface -> its records, in the order they were written
+        self._records: dict[int, list[list]] = {WLAN.IF_AP: [], WLAN.IF_STA: []}
+        self._speed: float = speed
+
+        with open(path) as file:
+            for line in file:
+                if line.strip():
+                    record: list = loads(line)
+                    self._records[record[1]].append(record)
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def speed(self) -> float:
+        return self._speed
+
+    def install(self) -> None:
+        # Interfaces created afterwards talk to the trace, so install it before creating them.
+        for interface in (WLAN.IF_AP, WLAN.IF_STA):
+            self._originals[interface] = radio.wlan(interface)
+            radio.use(
+                interface=interface,
+                wlan=_Replaying(
+                    interface=interface,
+                    records=self._records[interface],
+                    speed=self._speed,
+                ),
+            )
+
+    def uninstall(self) -> None:
+        for interface, wlan in self._originals.items():
+            radio.use(interface=interface, wlan=wlan)
+        self._originals.clear()
@@ -0,0 +1,303 @@
+"""
+Host-side benchmarks for the assistant module using the simulated network module.
+
+Run from the repository root with the simulator first on the module search path:
+
+    PYTHONPATH=simulator:. python3 benchmark/benchmark.py
+    MICROPYPATH=simulator:.:.frozen micropython benchmark/benchmark.py
+"""
+
+from network import WLAN, AccessPoint, environment
+from time import ticks_diff, ticks_ms
+
+from asyncio import CancelledError, Event, create_task, run, sleep
+from gc import collect
+from json import loads
+from os import remove
+from sys import argv
+
+from assistant import AP, Interface, Recorder, Replay, Station, scan
+from assistant.monitor import _Monitor
+from assistant.radio import radio
+
+try:
+    from gc import disable, enable, mem_alloc
+except ImportError:
+    import tracemalloc
+
+    mem_alloc = None
+
+
+class _Allocations:
+    """
+    Bytes allocated between 'start' and 'stop', using the GC heap counter where available
+    """
+
+    def __init__(self) -> None:
+        self._reference: int = 0
+
+    def start(self) -> None:
+        collect()
+        if mem_alloc:
+            disable()
+            self._reference = mem_alloc()
+        else:
+            tracemalloc.start()
+            tracemalloc.reset_peak()
+            self._reference = tracemalloc.get_traced_memory()[0]
+
+    def stop(self) -> int:
+        if mem_alloc:
+            allocated: int = mem_alloc() - self._reference
+            enable()
+        else:
+            allocated: int = tracemalloc.get_traced_memory()[1] - self._reference
+            tracemalloc.stop()
+        return allocated
+
+
+class _Counted(_Monitor):
+    """
+    Monitor that counts completed watch cycles and measures allocations per cycle
+    """
+
+    allocations: _Allocations = _Allocations()
+    cycles: int = 0
+    samples: list[int] = []
+
+    @classmethod
+    async def _stall(cls, seconds: int) -> None:
+        cls.cycles += 1
+        if cls.cycles > 1:
+            cls.samples.append(cls.allocations.stop())
+        await sleep(seconds)
+        cls.allocations.start()
+
+
+def _report(name: str, samples: list, unit: str) -> None:
+    if not samples:
+        print(f"{name}: no samples")
+        return
+    samples = sorted(samples)
+    print(
+        f"{name}: min {samples[0]} {unit}, "
+        f"median {samples[len(samples) // 2]} {unit}, "
+        f"max {samples[-1]} {unit} ({len(samples)} samples)"
+    )
+
+
+async def _watched(connected: Event, joined: list, stations: list, **kwargs):
+    async def connectedCallback(interface: Interface) -> None:
+        joined.append((interface, ticks_ms()))
+        connected.set()
+
+    return create_task(
+        _Counted.watch(connectedCallback=connectedCallback, stations=stations, **kwargs)
+    )
+
+
+async def _cancel(task) -> None:
+    task.cancel()
+    try:
+        await task
+    except CancelledError:
+        pass
+
+
+async def benchmark_allocations(cycles: int = 50) -> None:
+    """
+    Bytes allocated per watch cycle while connected to a healthy station
+    """
+    environment.reset(scanning=0)
+    environment.add(AccessPoint("primary", "password", association=0, dhcp=0))
+    environment.add(*[AccessPoint(f"foreign-{_}", rssi=-80) for _ in range(20)])
+    _Counted.cycles = 0
+    _Counted.samples = []
+    task = await _watched(
+        connected=Event(),
+        joined=[],
+        stations=[Station(password="password", ssid="primary")],
+        pause=0,
+    )
+    while _Counted.cycles <= cycles:
+        await sleep(0.01)
+    await _cancel(task)
+    _Counted.allocations.stop()
+    _report("Allocated per cycle", _Counted.samples[2:], "B")
+
+
+async def benchmark_cycles(duration: int = 2000) -> None:
+    """
+    Watch cycles per second while connected to a healthy station with an instant scan
+    """
+    environment.reset(scanning=0)
+    environment.add(AccessPoint("primary", "password", association=0, dhcp=0))
+    _Counted.cycles = 0
+    _Counted.samples = []
+    task = await _watched(
+        connected=Event(),
+        joined=[],
+        stations=[Station(password="password", ssid="primary")],
+        pause=0,
+    )
+    await sleep(duration / 1000)
+    cycles: int = _Counted.cycles
+    await _cancel(task)
+    _Counted.allocations.stop()
+    print(f"Watch cycles per second: {cycles * 1000 // duration}")
+
+
+async def benchmark_failover(
+    pause: int = 3, samples: int = 3, watchdog: int = 0
+) -> None:
+    """
+    Milliseconds between losing the only station and the fallback AP being configured
+    """
+    latencies: list[int] = []
+
+    for _ in range(samples):
+        environment.reset(scanning=1500)
+        environment.add(AccessPoint("primary", "password", association=300, dhcp=300))
+        connected: Event = Event()
+        joined: list = []
+        fallback: AP = AP(password="fallback", ssid="fallback")
+        task = await _watched(
+            connected=connected,
+            joined=joined,
+            stations=[Station(password="password", ssid="primary")],
+            fallback=fallback,
+            pause=pause,
+            watchdog=watchdog,
+        )
+        await connected.wait()
+        connected.clear()
+        reference: int = ticks_ms()
+        environment.remove("primary")
+        await connected.wait()
+        latencies.append(ticks_diff(joined[-1][1], reference))
+        await _cancel(task)
+        _Counted.allocations.stop()
+
+    _report(f"Time to failover (watchdog {watchdog} ms)", latencies, "ms")
+
+
+async def benchmark_replay(path: str = None, speed: float = 10) -> None:
+    """
+    Milliseconds of trace time until 'watch' is connected when replaying a trace, recording a temporary one if none is given
+    """
+    recorded: bool = path is None
+    if recorded:
+        path = "benchmark-trace.jsonl"
+        environment.reset(scanning=300)
+        environment.add(AccessPoint("primary", "password", association=700, dhcp=500))
+        recorder: Recorder = Recorder(path=path)
+        recorder.install()
+        connected: Event = Event()
+        reference: int = ticks_ms()
+        task = await _watched(
+            connected=connected,
+            joined=[],
+            stations=[Station(password="password", ssid="primary")],
+        )
+        await connected.wait()
+        print(f"Recorded time to watch joining: {ticks_diff(ticks_ms(), reference)} ms")
+        await _cancel(task)
+        recorder.uninstall()
+        radio.wlan(WLAN.IF_STA).active(False)
+
+    # The SSIDs joined in the trace stand for the stations, as passwords are never recorded.
+    ssids: list[str] = []
+    with open(path) as file:
+        for line in file:
+            record: list = loads(line)
+            if record[2] == "connect" and record[3] not in ssids:
+                ssids.append(record[3])
+
+    replay: Replay = Replay(path=path, speed=speed)
+    replay.install()
+    stations: list[Station] = [Station(password="", ssid=_) for _ in ssids]
+    for station in stations:
+        # Polls are spaced in real time, so they are sped up too to keep the same resolution.
+        station.pace(minimum=max(1, int(50 / speed)), maximum=max(1, int(1000 / speed)))
+    connected: Event = Event()
+    reference: int = ticks_ms()
+    task = await _watched(
+        connected=connected,
+        joined=[],
+        stations=stations,
+        pause=1 / speed,
+    )
+    await connected.wait()
+    elapsed: int = ticks_diff(ticks_ms(), reference)
+    await _cancel(task)
+    replay.uninstall()
+    print(
+        f"Replayed {path} at {speed}x, time to watch joining: {int(elapsed * speed)} ms"
+    )
+    if recorded:
+        remove(path)
+
+
+async def benchmark_scan_stall(scanning: int = 1500) -> None:
+    """
+    Longest gap seen by another task while a scan is in progress
+    """
+    environment.reset(scanning=scanning)
+    environment.add(AccessPoint("primary", "password"))
+    gaps: list[int] = []
+    task = create_task(scan())
+    reference: int = ticks_ms()
+    while not task.done():
+        await sleep(0.01)
+        gaps.append(ticks_diff(ticks_ms(), reference))
+        reference = ticks_ms()
+    await task
+
+    print(f"Longest event loop stall during a {scanning} ms scan: {max(gaps)} ms")
+
+
+async def benchmark_time_to_ip(pinned: bool = False, samples: int = 5) -> None:
+    """
+    Milliseconds between 'aconnect' being awaited and it returning with an IP address
+    """
+    latencies: list[int] = []
+
+    for _ in range(samples):
+        environment.reset(searching=1000)
+        accessPoint: AccessPoint = AccessPoint(
+            "primary", "password", association=700, dhcp=500
+        )
+        environment.add(accessPoint)
+        station: Station = Station(password="password", ssid="primary")
+        if pinned:
+            station.pin(bssid=accessPoint.bssid, channel=accessPoint.channel)
+        reference: int = ticks_ms()
+        connected: bool = await station.aconnect()
+        latencies.append(ticks_diff(ticks_ms(), reference))
+        assert connected, "'Time to IP' benchmark failed to connect!"
+        station.deactivate()
+
+    _report(
+        f"Time to IP ({'pinned' if pinned else 'unpinned'}, 1200 ms link + 1000 ms search)",
+        latencies,
+        "ms",
+    )
+
+
+async def main() -> None:
+    await benchmark_time_to_ip()
+    await benchmark_time_to_ip(pinned=True)
+    await benchmark_failover()
+    await benchmark_failover(watchdog=100)
+    await benchmark_scan_stall()
+    await benchmark_cycles()
+    await benchmark_allocations()
+    await benchmark_replay(*argv[1:2])
+
+
+try:
+    print("Running benchmarks")
+    run(main())
+finally:
+    environment.reset()
+    print("Goodbye!")
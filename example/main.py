@@ -4,16 +4,16 @@ It is meant to be used alongside a Raspberry Pi Pico W.
 """
 
 from asyncio import Task, create_task, gather, new_event_loop, run, sleep
-from json import load
 from machine import Pin
 from os import chdir, listdir
 
-from assistant import AP, Interface, Station, watch
+from assistant import AP, Interface, Store, watch
+from assistant.loader import credentials
 
 ap: AP = AP(password="raspberry")
 blinker: Task = None
 led: Pin = Pin("LED", mode=Pin.OUT, value=0)
-stations: list[Station] = []
+store: Store = None
 
 
 async def blink(frequency: int, target: Pin, pause: int = 1):
@@ -58,17 +58,12 @@ try:
 
     chdir("/")
     filename: str = "networks.json"
+    store = Store(path="networks.bin")
 
-    if filename in listdir():
+    # The JSON file is only read once, to fill an empty store.
+    if not len(store) and filename in listdir():
         with open(filename) as file:
-            if data := load(file):
-                for credentials in data:
-                    stations.append(
-                        Station(
-                            password=credentials.get("password"),
-                            ssid=credentials.get("ssid"),
-                        )
-                    )
+            print(f"Stored {store.extend(credentials(file))} networks")
 
     run(
         main(
@@ -79,7 +74,8 @@ try:
                     fallback=ap,
                     pause=15,
                     roam=False,
-                    stations=stations,
+                    stations=[],
+                    store=store,
                     verbose=True,
                 ),
             ]
@@ -90,6 +86,6 @@ except KeyboardInterrupt:
 finally:
     ap.deactivate()
     led.off()
-    [station.deactivate() for station in stations]
+    [station.deactivate() for station in store.stations] if store else None
     new_event_loop()
     print("Goodbye!")
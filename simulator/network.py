@@ -0,0 +1,275 @@
+"""
+Simulated stand-in for MicroPython's network module.
+
+Only the parts of network.WLAN used by assistant are modelled. Put the simulator directory
+first on the module search path (PYTHONPATH or MICROPYPATH). Under CPython the MicroPython tick
+helpers come from sitecustomize in the same directory.
+"""
+
+import sitecustomize
+import time
+
+from random import randint, seed
+
+STAT_CONNECT_FAIL: int = -1
+STAT_CONNECTING: int = 1
+STAT_GOT_IP: int = 3
+STAT_IDLE: int = 0
+STAT_NO_AP_FOUND: int = -2
+STAT_WRONG_PASSWORD: int = -3
+
+
+class AccessPoint:
+    """
+    Simulated access point visible to the STA interface
+    """
+
+    def __init__(
+        self,
+        ssid: str,
+        password: str = "",
+        association: int = 500,
+        bssid: bytes = None,
+        channel: int = 1,
+        dhcp: int = 500,
+        failure: int = None,
+        hidden: bool = False,
+        noise: int = 0,
+        rssi: int = -50,
+        security: int = 3,
+    ) -> None:
+        counter: int = environment.counter
+        self.association: int = association
+        self.bssid: bytes = bssid or bytes((2, 0, 0, 0, counter >> 8, counter & 0xFF))
+        self.channel: int = channel
+        self.dhcp: int = dhcp
+        self.failure: int = failure
+        self.hidden: bool = hidden
+        self.noise: int = noise
+        self.password: str = password
+        self.rssi: int = rssi
+        self.security: int = security if password else 0
+        self.ssid: str = ssid
+        environment.counter += 1
+
+    def __repr__(self) -> str:
+        return f"AccessPoint({self.ssid!r}, rssi={self.rssi}, channel={self.channel})"
+
+
+class _Link:
+    """
+    Radio state shared by every WLAN object of the same interface
+    """
+
+    def __init__(self, interface: int) -> None:
+        self.active: bool = False
+        self.config: dict = {"pm": WLAN.PM_PERFORMANCE, "ssid": ""}
+        self.delay: int = 0
+        self.interface: int = interface
+        self.key: str = None
+        self.reference: int = 0
+        self.ssid: str = None
+        self.static: tuple = None
+        self.target: AccessPoint = None
+
+        if interface == WLAN.IF_AP:
+            self.config["ssid"] = "PICO-0000"
+
+    def drop(self) -> None:
+        self.key = None
+        self.ssid = None
+        self.target = None
+
+
+class Environment:
+    """
+    Scriptable radio environment observed by every simulated WLAN
+    """
+
+    def __init__(self) -> None:
+        self.counter: int = 0
+        self.reset()
+
+    def add(self, *accessPoints: AccessPoint) -> None:
+        self.accessPoints.extend(accessPoints)
+
+    def find(self, ssid: str, bssid: bytes = None) -> AccessPoint | None:
+        for accessPoint in self.accessPoints:
+            if accessPoint.ssid == ssid and (
+                bssid is None or accessPoint.bssid == bssid
+            ):
+                return accessPoint
+        return None
+
+    def remove(self, ssid: str) -> None:
+        self.accessPoints = [_ for _ in self.accessPoints if _.ssid != ssid]
+
+    def reset(
+        self,
+        configure: int = 200,
+        scanning: int = 1500,
+        searching: int = 0,
+        state: int = 0,
+    ) -> None:
+        """
+        Forget every access point and return both interfaces to their power-on state.
+        'configure' and 'scanning' are the milliseconds an AP takes to come up and a scan blocks,
+        'searching' is the extra time a connect without a BSSID spends looking for the network.
+        """
+        self.accessPoints: list[AccessPoint] = []
+        self.configure: int = configure
+        self.connects: int = 0
+        self.links: dict = {
+            WLAN.IF_AP: _Link(WLAN.IF_AP),
+            WLAN.IF_STA: _Link(WLAN.IF_STA),
+        }
+        self.scanning: int = scanning
+        self.scans: int = 0
+        self.searching: int = searching
+        seed(state)
+
+
+class WLAN:
+    """
+    Simulated network.WLAN
+    """
+
+    IF_AP: int = 1
+    IF_STA: int = 0
+    PM_NONE: int = 0x10
+    PM_PERFORMANCE: int = 0xA11142
+    PM_POWERSAVE: int = 0x111022
+
+    def __init__(self, interface: int = IF_STA) -> None:
+        self._interface: int = interface
+
+    @property
+    def _link(self) -> _Link:
+        # Looked up on every call, so WLANs cached by assistant follow 'environment.reset'.
+        return environment.links[self._interface]
+
+    def __repr__(self) -> str:
+        return f"<CYW43 {'AP' if self._link.interface == WLAN.IF_AP else 'STA'} {self.status()}>"
+
+    def active(self, value: bool = None) -> bool | None:
+        link: _Link = self._link
+        if value is None:
+            return link.active
+        if not value:
+            link.drop()
+            # The firmware defaults for power management and DHCP come back with the radio.
+            link.config["pm"] = WLAN.PM_PERFORMANCE
+            link.static = None
+        elif not link.active:
+            link.reference = time.ticks_ms()
+        link.active = bool(value)
+
+    def config(self, *args, **kwargs):
+        link: _Link = self._link
+        if args:
+            if args[0] == "rssi":
+                return self.status("rssi")
+            return link.config[args[0]]
+        for key, value in kwargs.items():
+            link.config["password" if key == "key" else key] = value
+
+    def connect(
+        self,
+        ssid: str = None,
+        key: str = None,
+        *,
+        bssid: bytes = None,
+        channel: int = -1,
+    ) -> None:
+        link: _Link = self._link
+        if not link.active:
+            raise OSError("STA must be active")
+        environment.connects += 1
+        link.delay = 0 if bssid else environment.searching
+        link.key = key or ""
+        link.reference = time.ticks_ms()
+        link.ssid = ssid
+        link.target = environment.find(ssid, bssid)
+        if link.target and channel not in (-1, link.target.channel):
+            link.target = None
+        link.config["ssid"] = ssid
+
+    def disconnect(self) -> None:
+        self._link.drop()
+
+    def ifconfig(self, *args) -> tuple | None:
+        link: _Link = self._link
+        if args:
+            # A tuple sets a static configuration that skips DHCP, "dhcp" goes back to asking for one.
+            if args[0] == "dhcp":
+                # lwIP ports wait for an address, which cannot come before association.
+                if self.status() != STAT_GOT_IP:
+                    raise OSError("DHCP timed out")
+                link.static = None
+            else:
+                link.static = tuple(args[0])
+            return None
+        if link.interface == WLAN.IF_AP:
+            return ("192.168.4.1", "255.255.255.0", "192.168.4.1", "0.0.0.0")
+        if self.status() != STAT_GOT_IP:
+            return ("0.0.0.0", "0.0.0.0", "0.0.0.0", "0.0.0.0")
+        if link.static:
+            return link.static
+        return ("192.168.1.100", "255.255.255.0", "192.168.1.1", "192.168.1.1")
+
+    def isconnected(self) -> bool:
+        return self.status() == STAT_GOT_IP
+
+    def scan(self) -> list[tuple]:
+        if not self._link.active:
+            raise OSError("STA must be active")
+        environment.scans += 1
+        time.sleep(environment.scanning / 1000)
+        return [
+            (
+                b"" if _.hidden else _.ssid.encode(),
+                _.bssid,
+                _.channel,
+                _.rssi + (randint(-_.noise, _.noise) if _.noise else 0),
+                _.security,
+                _.hidden,
+            )
+            for _ in environment.accessPoints
+        ]
+
+    def status(self, parameter: str = None) -> int:
+        link: _Link = self._link
+
+        if parameter == "rssi":
+            return link.target.rssi if self.status() == STAT_GOT_IP else 0
+
+        if not link.active:
+            return STAT_IDLE
+
+        elapsed: int = time.ticks_diff(time.ticks_ms(), link.reference) - link.delay
+
+        if link.interface == WLAN.IF_AP:
+            return STAT_GOT_IP if elapsed >= environment.configure else STAT_CONNECTING
+
+        if link.ssid is None:
+            return STAT_IDLE
+
+        target: AccessPoint = link.target
+
+        if target is None:
+            return STAT_CONNECTING if elapsed < 1000 else STAT_NO_AP_FOUND
+        if elapsed < target.association:
+            return STAT_CONNECTING
+        if target.security and target.password != link.key:
+            return STAT_WRONG_PASSWORD
+        if target.failure is not None:
+            return target.failure
+        if not link.static and elapsed < target.association + target.dhcp:
+            return STAT_CONNECTING
+        if target not in environment.accessPoints:
+            return STAT_NO_AP_FOUND
+
+        return STAT_GOT_IP
+
+
+environment: Environment = Environment()
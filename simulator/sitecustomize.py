@@ -0,0 +1,24 @@
+"""
+MicroPython tick helpers for CPython, installed at interpreter start-up.
+
+CPython imports this module by itself whenever the simulator directory is on PYTHONPATH, so
+assistant and the tests can be imported in any order. The simulated network module imports it too,
+for when the simulator directory is added to the module search path at runtime instead.
+"""
+
+import time
+
+if not hasattr(time, "ticks_ms"):
+
+    def _ticks_add(ticks: int, delta: int) -> int:
+        return ticks + delta
+
+    def _ticks_diff(new: int, old: int) -> int:
+        return new - old
+
+    def _ticks_ms() -> int:
+        return int(time.monotonic() * 1000)
+
+    time.ticks_add = _ticks_add
+    time.ticks_diff = _ticks_diff
+    time.ticks_ms = _ticks_ms
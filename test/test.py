@@ -10,6 +10,7 @@ from network import (
 from os import chdir, listdir
 
 from assistant import Interface, Station
+from assistant.interface import LOW_LATENCY, LOW_POWER
 
 
 def test_connect_failed(password: str, ssid: str, verbose: bool = False):
@@ -73,6 +74,44 @@ def test_no_ap_found(password: str, ssid: str, verbose: bool = False):
     print("Test 'No AP Found' Passed", "", sep="\n")
 
 
+def test_profile(password: str, ssid: str, verbose: bool = False):
+    """
+    Testing 'Profile'
+    """
+    print("Testing 'Profile'")
+    station: Station = Station(password=password, ssid=ssid)
+    station.tune(profile=LOW_LATENCY)
+    _: bool = station.connect(verbose=verbose)
+    wlan: WLAN = station.wlan
+    assert wlan.config("pm") == WLAN.PM_NONE, "'Profile' test has failed!"
+    station.tune(profile=LOW_POWER)
+    assert wlan.config("pm") == WLAN.PM_POWERSAVE, "'Profile' test has failed!"
+    station.deactivate()
+    print("Test 'Profile' Passed", "", sep="\n")
+
+
+def test_profile_validation(password: str, ssid: str):
+    """
+    Testing 'profile' validation
+    """
+    print("Testing 'profile' validation")
+    station: Station = Station(password=password, ssid=ssid)
+
+    try:
+        station.tune(profile="LOW_POWER")
+    except TypeError as _:
+        print(f"Caught error: {_}")
+        print("Test 1 of 2 of 'profile' Passed")
+
+    try:
+        station.tune(profile=-1)
+    except ValueError as _:
+        print(f"Caught error: {_}")
+        print("Test 2 of 2 of 'profile' Passed")
+
+    print("Test 'profile' Passed", "", sep="\n")
+
+
 def test_timeout(password: str, ssid: str, verbose: bool = False):
     """
     Testing 'Timeout'
@@ -155,6 +194,10 @@ try:
         ssid=credentials.get("ssid"),
         verbose="True",
     )
+    test_profile_validation(
+        password=credentials.get("password"),
+        ssid=credentials.get("ssid"),
+    )
 
     test_no_ap_found(
         password=credentials.get("password"),
@@ -192,6 +235,12 @@ try:
         ssid=credentials.get("ssid"),
         verbose=True,
     )
+
+    test_profile(
+        password=credentials.get("password"),
+        ssid=credentials.get("ssid"),
+        verbose=True,
+    )
 except OSError as error:
     print(f"OSError: {error}")
 else:
@@ -0,0 +1,91 @@
+from time import sleep
+
+from assistant import Budget
+
+
+class Candidate:
+    """
+    Stand-in for a Station, as the budget only reads its SSID
+    """
+
+    def __init__(self, ssid: str) -> None:
+        self.ssid: str = ssid
+
+
+def test_allotment():
+    """
+    Testing 'Allotment'
+    """
+    print("Testing 'Allotment'")
+    budget: Budget = Budget(cycle=60, minimum=2, reserve=15)
+    candidates: list[tuple] = [
+        (Candidate(ssid="strong"), (b"strong", b"\x01", 1, -40, 3, False)),
+        (Candidate(ssid="weak"), (b"weak", b"\x02", 6, -70, 3, False)),
+    ]
+    strong: float = budget.allot(candidates=candidates, position=0)
+    assert 29.9 < strong <= 30, "'Allotment' test has failed!"
+    assert (
+        budget.allot(candidates=candidates, position=1) <= 45
+    ), "'Allotment' test has failed!"
+    budget.record(ssid="strong", joined=False)
+    assert (
+        budget.allot(candidates=candidates, position=0) < strong
+    ), "'Allotment' test has failed!"
+    budget.record(ssid="strong", joined=True)
+    recovered: float = budget.allot(candidates=candidates, position=0)
+    assert abs(recovered - strong) < 0.1, "'Allotment' test has failed!"
+    print("Test 'Allotment' Passed", "", sep="\n")
+
+
+def test_reserve():
+    """
+    Testing 'Reserve'
+    """
+    print("Testing 'Reserve'")
+    budget: Budget = Budget(cycle=10, minimum=2, reserve=8)
+    candidates: list[tuple] = [
+        (Candidate(ssid="only"), (b"only", b"\x01", 1, -40, 3, False))
+    ]
+    assert (
+        budget.allot(candidates=candidates, position=0) <= 2
+    ), "'Reserve' test has failed!"
+    sleep(0.1)
+    assert (
+        budget.allot(candidates=candidates, position=0) == 0
+    ), "'Reserve' test has failed!"
+    assert 9 < budget.bound(timeout=15) <= 10, "'Reserve' test has failed!"
+    assert budget.bound(timeout=5) == 5, "'Reserve' test has failed!"
+    print("Test 'Reserve' Passed", "", sep="\n")
+
+
+def test_validation():
+    """
+    Testing 'Budget' validation
+    """
+    print("Testing 'Budget' validation")
+
+    try:
+        _: Budget = Budget(reserve=0)
+    except ValueError as _:
+        print(f"Caught error: {_}")
+        print("Test 1 of 2 of 'Budget' Passed")
+
+    try:
+        _: Budget = Budget(cycle=10, minimum=2, reserve=9)
+    except ValueError as _:
+        print(f"Caught error: {_}")
+        print("Test 2 of 2 of 'Budget' Passed")
+
+    print("Test 'Budget' validation Passed", "", sep="\n")
+
+
+try:
+    test_validation()
+    test_allotment()
+    test_reserve()
+except AssertionError as error:
+    print(f"AssertionError: {error}")
+else:
+    print("All tests passed!")
+finally:
+    print("Goodbye!")
@@ -0,0 +1,123 @@
+from asyncio import run, sleep
+
+from assistant import Bus
+from assistant.bus import CONNECTED, DISCONNECTED, DROP_NEWEST, LOST
+
+
+def test_errors():
+    """
+    Testing 'Errors'
+    """
+
+    async def broken(interface: str) -> None:
+        raise RuntimeError("broken")
+
+    async def connected(interface: str) -> None:
+        delivered.append(interface)
+
+    async def publishing() -> None:
+        bus.start()
+        bus.publish(event=CONNECTED, interface="network")
+        await sleep(0.1)
+        bus.stop()
+
+    print("Testing 'Errors'")
+    delivered: list[str] = []
+    bus: Bus = Bus()
+    bus.subscribe(event=CONNECTED, callback=broken)
+    bus.subscribe(event=CONNECTED, callback=connected)
+    run(publishing())
+    assert bus.errors == 1, "'Errors' test has failed!"
+    assert delivered == ["network"], "'Errors' test has failed!"
+    print("Test 'Errors' Passed", "", sep="\n")
+
+
+def test_ordering():
+    """
+    Testing 'Ordering'
+    """
+
+    async def connected(interface: str) -> None:
+        await sleep(0.01)
+        delivered.append(("connected", interface))
+
+    async def disconnected(interface: str) -> None:
+        delivered.append(("disconnected", interface))
+
+    async def lost(interface: str, latency: int) -> None:
+        delivered.append(("lost", interface, latency))
+
+    async def publishing() -> None:
+        bus.start()
+        bus.publish(event=LOST, interface="first", value=50)
+        bus.publish(event=DISCONNECTED, interface="first")
+        bus.publish(event=CONNECTED, interface="second")
+        await sleep(0.1)
+        bus.stop()
+
+    print("Testing 'Ordering'")
+    delivered: list[tuple] = []
+    bus: Bus = Bus()
+    bus.subscribe(event=CONNECTED, callback=connected)
+    bus.subscribe(event=DISCONNECTED, callback=disconnected)
+    bus.subscribe(event=LOST, callback=lost)
+    run(publishing())
+    expected: list[tuple] = [
+        ("lost", "first", 50),
+        ("disconnected", "first"),
+        ("connected", "second"),
+    ]
+    assert delivered == expected, "'Ordering' test has failed!"
+    print("Test 'Ordering' Passed", "", sep="\n")
+
+
+def test_overflow():
+    """
+    Testing 'Overflow'
+    """
+    print("Testing 'Overflow'")
+    oldest: Bus = Bus(capacity=2)
+    newest: Bus = Bus(capacity=2, overflow=DROP_NEWEST)
+    for interface in ("first", "second", "third"):
+        oldest.publish(event=CONNECTED, interface=interface)
+        newest.publish(event=CONNECTED, interface=interface)
+    assert oldest.dropped == newest.dropped == 1, "'Overflow' test has failed!"
+    assert oldest.pending == newest.pending == 2, "'Overflow' test has failed!"
+    assert not newest.publish(
+        event=CONNECTED, interface="fourth"
+    ), "'Overflow' test has failed!"
+    print("Test 'Overflow' Passed", "", sep="\n")
+
+
+def test_validation():
+    """
+    Testing 'Bus' validation
+    """
+    print("Testing 'Bus' validation")
+
+    try:
+        _: Bus = Bus(capacity=0)
+    except ValueError as _:
+        print(f"Caught error: {_}")
+        print("Test 1 of 2 of 'Bus' Passed")
+
+    try:
+        _: Bus = Bus(overflow=2)
+    except ValueError as _:
+        print(f"Caught error: {_}")
+        print("Test 2 of 2 of 'Bus' Passed")
+
+    print("Test 'Bus' validation Passed", "", sep="\n")
+
+
+try:
+    test_validation()
+    test_overflow()
+    test_ordering()
+    test_errors()
+except AssertionError as error:
+    print(f"AssertionError: {error}")
+else:
+    print("All tests passed!")
+finally:
+    print("Goodbye!")
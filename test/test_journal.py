@@ -0,0 +1,67 @@
+from assistant import Journal
+from assistant.journal import FAILED, JOINED, SCANNED
+
+
+def test_ordering():
+    """
+    Testing 'Ordering'
+    """
+    print("Testing 'Ordering'")
+    journal: Journal = Journal(capacity=3)
+    for value in range(5):
+        journal.record(kind=SCANNED, value=value)
+    values: list[int] = [event[3] for event in journal.events]
+    assert values == [2, 3, 4], "'Ordering' test has failed!"
+    ticks: list[int] = [event[0] for event in journal.events]
+    assert ticks == sorted(ticks), "'Ordering' test has failed!"
+    print("Test 'Ordering' Passed", "", sep="\n")
+
+
+def test_recording():
+    """
+    Testing 'Recording'
+    """
+    print("Testing 'Recording'")
+    journal: Journal = Journal()
+    journal.record(kind=FAILED, subject="network", value=-3)
+    journal.record(kind=JOINED, subject="network", value=1200)
+    kinds: list[str] = [event[1] for event in journal.events]
+    assert kinds == ["failed", "joined"], "'Recording' test has failed!"
+    assert journal.events[0][2:] == ("network", -3), "'Recording' test has failed!"
+    assert len(journal.since(journal.events[1][0])) >= 1, "'Recording' test has failed!"
+    journal.clear()
+    assert journal.events == [], "'Recording' test has failed!"
+    print("Test 'Recording' Passed", "", sep="\n")
+
+
+def test_validation():
+    """
+    Testing 'Journal' validation
+    """
+    print("Testing 'Journal' validation")
+
+    try:
+        _: Journal = Journal(capacity=0)
+    except ValueError as _:
+        print(f"Caught error: {_}")
+        print("Test 1 of 2 of 'Journal' Passed")
+
+    try:
+        _: Journal = Journal(batch=0)
+    except ValueError as _:
+        print(f"Caught error: {_}")
+        print("Test 2 of 2 of 'Journal' Passed")
+
+    print("Test 'Journal' validation Passed", "", sep="\n")
+
+
+try:
+    test_validation()
+    test_recording()
+    test_ordering()
+except AssertionError as error:
+    print(f"AssertionError: {error}")
+else:
+    print("All tests passed!")
+finally:
+    print("Goodbye!")
@@ -0,0 +1,78 @@
+from os import listdir, remove
+from time import sleep
+
+from assistant.leases import Leases
+
+config: tuple = ("192.168.1.100", "255.255.255.0", "192.168.1.1", "192.168.1.1")
+bssid: bytes = b"\x01\x02\x03\x04\x05\x06"
+filename: str = "leases.json"
+
+
+def test_expiry():
+    """
+    Testing 'Expiry'
+    """
+    print("Testing 'Expiry'")
+    leases: Leases = Leases(lifetime=1)
+    leases.save(bssid=bssid, config=config, ssid="network")
+    assert (
+        leases.lookup(bssid=bssid, ssid="network") == config
+    ), "'Expiry' test has failed!"
+    sleep(2.1)
+    assert (
+        leases.lookup(bssid=bssid, ssid="network") is None
+    ), "'Expiry' test has failed!"
+    print("Test 'Expiry' Passed", "", sep="\n")
+
+
+def test_lookup():
+    """
+    Testing 'Lookup'
+    """
+    print("Testing 'Lookup'")
+    leases: Leases = Leases(path=filename)
+    leases.save(bssid=bssid, config=config, ssid="network")
+    reloaded: Leases = Leases(path=filename)
+    assert (
+        reloaded.lookup(bssid=bssid, ssid="network") == config
+    ), "'Lookup' test has failed!"
+    # Another access point of the same network may hand out addresses from another subnet.
+    other: tuple = reloaded.lookup(bssid=b"\x06\x05\x04\x03\x02\x01", ssid="network")
+    assert other is None, "'Lookup' test has failed!"
+    reloaded.forget(ssid="network")
+    assert (
+        reloaded.lookup(bssid=bssid, ssid="network") is None
+    ), "'Lookup' test has failed!"
+    assert (
+        Leases(path=filename).lookup(bssid=bssid, ssid="network") is None
+    ), "'Lookup' test has failed!"
+    print("Test 'Lookup' Passed", "", sep="\n")
+
+
+def test_validation():
+    """
+    Testing 'Leases' validation
+    """
+    print("Testing 'Leases' validation")
+
+    try:
+        _: Leases = Leases(lifetime=0)
+    except ValueError as _:
+        print(f"Caught error: {_}")
+        print("Test 1 of 1 of 'Leases' Passed")
+
+    print("Test 'Leases' validation Passed", "", sep="\n")
+
+
+try:
+    test_validation()
+    test_lookup()
+    test_expiry()
+except AssertionError as error:
+    print(f"AssertionError: {error}")
+else:
+    print("All tests passed!")
+finally:
+    if filename in listdir():
+        remove(filename)
+    print("Goodbye!")
@@ -0,0 +1,62 @@
+from io import BytesIO, StringIO
+
+from assistant.loader import credentials
+
+
+def test_streaming():
+    """
+    Testing 'Streaming'
+    """
+    print("Testing 'Streaming'")
+    document: str = (
+        '[{"ssid": "first {", "password": "one \\" ]"},'
+        ' {"password": "orphan"},'
+        ' {"ssid": "second", "channel": 6, "tags": ["a", "b"]}]'
+    )
+    entries: list[tuple] = list(credentials(StringIO(document), size=5))
+    expected: list[tuple] = [
+        ("first {", 'one " ]', {}),
+        ("second", "", {"channel": 6, "tags": ["a", "b"]}),
+    ]
+    assert entries == expected, "'Streaming' test has failed!"
+    print("Test 'Streaming' Passed", "", sep="\n")
+
+
+def test_validation():
+    """
+    Testing 'Loader' validation
+    """
+    print("Testing 'Loader' validation")
+
+    try:
+        list(credentials(StringIO('[{"ssid": "' + "x" * 64 + '"}]'), limit=32))
+    except ValueError as _:
+        print(f"Caught error: {_}")
+        print("Test 1 of 3 of 'Loader' Passed")
+
+    try:
+        list(credentials(StringIO("[]"), size=0))
+    except ValueError as _:
+        print(f"Caught error: {_}")
+        print("Test 2 of 3 of 'Loader' Passed")
+
+    try:
+        list(credentials(BytesIO(b'[{"ssid": "network"}]')))
+    except TypeError as _:
+        print(f"Caught error: {_}")
+        print("Test 3 of 3 of 'Loader' Passed")
+    else:
+        raise AssertionError("'Loader' validation test has failed!")
+
+    print("Test 'Loader' validation Passed", "", sep="\n")
+
+
+try:
+    test_validation()
+    test_streaming()
+except AssertionError as error:
+    print(f"AssertionError: {error}")
+else:
+    print("All tests passed!")
+finally:
+    print("Goodbye!")
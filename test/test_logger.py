@@ -0,0 +1,74 @@
+from assistant import Logger, Ring
+from assistant.logger import DEBUG, INFO, WARNING
+
+
+def test_enabled():
+    """
+    Testing 'Enabled'
+    """
+    print("Testing 'Enabled'")
+    logger: Logger = Logger(level=INFO)
+    assert not logger.enabled(level=WARNING), "'Enabled' test has failed!"
+    assert logger.enabled(level=DEBUG, verbose=True), "'Enabled' test has failed!"
+    logger.attach(Ring())
+    assert logger.enabled(level=WARNING), "'Enabled' test has failed!"
+    assert not logger.enabled(level=DEBUG), "'Enabled' test has failed!"
+    print("Test 'Enabled' Passed", "", sep="\n")
+
+
+def test_levels():
+    """
+    Testing 'Levels'
+    """
+    print("Testing 'Levels'")
+    logger: Logger = Logger(level=INFO)
+    ring: Ring = Ring()
+    logger.attach(ring)
+    logger.log(level=DEBUG, message="hidden")
+    logger.log(level=WARNING, message="shown")
+    assert len(ring.lines) == 1, "'Levels' test has failed!"
+    assert ring.lines[0].endswith("WARNING shown"), "'Levels' test has failed!"
+    print("Test 'Levels' Passed", "", sep="\n")
+
+
+def test_ring():
+    """
+    Testing 'Ring'
+    """
+    print("Testing 'Ring'")
+    ring: Ring = Ring(capacity=3)
+    for number in range(5):
+        ring.write(level=INFO, message=f"{number}")
+    lines: list[str] = [line[-1] for line in ring.lines]
+    assert lines == ["2", "3", "4"], "'Ring' test has failed!"
+    ring.clear()
+    assert ring.lines == [], "'Ring' test has failed!"
+    print("Test 'Ring' Passed", "", sep="\n")
+
+
+def test_validation():
+    """
+    Testing 'Ring' validation
+    """
+    print("Testing 'Ring' validation")
+
+    try:
+        _: Ring = Ring(capacity=0)
+    except ValueError as _:
+        print(f"Caught error: {_}")
+        print("Test 1 of 1 of 'Ring' Passed")
+
+    print("Test 'Ring' validation Passed", "", sep="\n")
+
+
+try:
+    test_validation()
+    test_enabled()
+    test_levels()
+    test_ring()
+except AssertionError as error:
+    print(f"AssertionError: {error}")
+else:
+    print("All tests passed!")
+finally:
+    print("Goodbye!")
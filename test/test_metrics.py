@@ -0,0 +1,73 @@
+from assistant import Histogram, Metrics
+
+
+def test_counters():
+    """
+    Testing 'Counters'
+    """
+    print("Testing 'Counters'")
+    metrics: Metrics = Metrics()
+    metrics.count_failure(status=-2)
+    metrics.count_failure(status=-2)
+    metrics.count_fallback()
+    metrics.connects.observe(1200)
+    assert metrics.failures == {-2: 2}, "'Counters' test has failed!"
+    assert metrics.fallbacks == 1, "'Counters' test has failed!"
+    assert metrics.joins == 1, "'Counters' test has failed!"
+    metrics.reset()
+    assert metrics.summary()["connects"] == (
+        0,
+        None,
+        None,
+        0,
+    ), "'Counters' test has failed!"
+    print("Test 'Counters' Passed", "", sep="\n")
+
+
+def test_histogram():
+    """
+    Testing 'Histogram'
+    """
+    print("Testing 'Histogram'")
+    histogram: Histogram = Histogram(bounds=(100, 200, 300))
+    for value in (50, 150, 160, 250, 900):
+        histogram.observe(value)
+    counts: list[int] = [count for _, count in histogram.buckets]
+    assert counts == [1, 2, 1, 1], "'Histogram' test has failed!"
+    assert histogram.percentile(0.5) == 200, "'Histogram' test has failed!"
+    assert histogram.percentile(1) == 900, "'Histogram' test has failed!"
+    assert histogram.mean == 302, "'Histogram' test has failed!"
+    print("Test 'Histogram' Passed", "", sep="\n")
+
+
+def test_validation():
+    """
+    Testing 'Histogram' validation
+    """
+    print("Testing 'Histogram' validation")
+
+    try:
+        _: Histogram = Histogram(bounds=(200, 100))
+    except ValueError as _:
+        print(f"Caught error: {_}")
+        print("Test 1 of 2 of 'Histogram' Passed")
+
+    try:
+        Histogram(bounds=(100,)).percentile(0)
+    except ValueError as _:
+        print(f"Caught error: {_}")
+        print("Test 2 of 2 of 'Histogram' Passed")
+
+    print("Test 'Histogram' validation Passed", "", sep="\n")
+
+
+try:
+    test_validation()
+    test_histogram()
+    test_counters()
+except AssertionError as error:
+    print(f"AssertionError: {error}")
+else:
+    print("All tests passed!")
+finally:
+    print("Goodbye!")
@@ -0,0 +1,80 @@
+from time import sleep
+
+from assistant import Quarantine
+
+
+def test_cooldown_growth():
+    """
+    Testing 'Cool-down Growth'
+    """
+    print("Testing 'Cool-down Growth'")
+    quarantine: Quarantine = Quarantine(base=10, ceiling=25)
+    cooldowns: list[int] = [quarantine.fail(ssid="network") for _ in range(3)]
+    assert cooldowns == [10, 20, 25], "'Cool-down Growth' test has failed!"
+    print("Test 'Cool-down Growth' Passed", "", sep="\n")
+
+
+def test_expiry():
+    """
+    Testing 'Expiry'
+    """
+    print("Testing 'Expiry'")
+    quarantine: Quarantine = Quarantine(base=1)
+    quarantine.fail(ssid="network", status=-1)
+    assert quarantine.quarantined("network"), "'Expiry' test has failed!"
+    assert quarantine.networks == {"network": (1, 1, -1)}, "'Expiry' test has failed!"
+    sleep(1.1)
+    assert not quarantine.quarantined("network"), "'Expiry' test has failed!"
+    assert quarantine.networks == {}, "'Expiry' test has failed!"
+    print("Test 'Expiry' Passed", "", sep="\n")
+
+
+def test_release():
+    """
+    Testing 'Release'
+    """
+    print("Testing 'Release'")
+    quarantine: Quarantine = Quarantine()
+    quarantine.fail(ssid="first")
+    quarantine.fail(ssid="second")
+    quarantine.release(ssid="first")
+    assert not quarantine.quarantined("first"), "'Release' test has failed!"
+    assert quarantine.quarantined("second"), "'Release' test has failed!"
+    quarantine.release()
+    assert not quarantine.quarantined("second"), "'Release' test has failed!"
+    assert quarantine.fail(ssid="second") == 30, "'Release' test has failed!"
+    print("Test 'Release' Passed", "", sep="\n")
+
+
+def test_validation():
+    """
+    Testing 'Quarantine' validation
+    """
+    print("Testing 'Quarantine' validation")
+
+    try:
+        _: Quarantine = Quarantine(base=0)
+    except ValueError as _:
+        print(f"Caught error: {_}")
+        print("Test 1 of 2 of 'Quarantine' Passed")
+
+    try:
+        _: Quarantine = Quarantine(base=10, ceiling=5)
+    except ValueError as _:
+        print(f"Caught error: {_}")
+        print("Test 2 of 2 of 'Quarantine' Passed")
+
+    print("Test 'Quarantine' validation Passed", "", sep="\n")
+
+
+try:
+    test_validation()
+    test_cooldown_growth()
+    test_release()
+    test_expiry()
+except AssertionError as error:
+    print(f"AssertionError: {error}")
+else:
+    print("All tests passed!")
+finally:
+    print("Goodbye!")
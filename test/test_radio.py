@@ -0,0 +1,67 @@
+from asyncio import gather, run, sleep
+
+from assistant import Radio
+from assistant.radio import JOIN
+
+
+def test_coalescing():
+    """
+    Testing 'Coalescing'
+    """
+
+    async def operation() -> int:
+        performed.append(None)
+        await sleep(0.05)
+        return len(performed)
+
+    async def performing() -> list:
+        return await gather(
+            radio.perform(key="scan", operation=operation),
+            radio.perform(key="scan", operation=operation),
+        )
+
+    print("Testing 'Coalescing'")
+    performed: list = []
+    radio: Radio = Radio()
+    results: list = run(performing())
+    assert results == [1, 1], "'Coalescing' test has failed!"
+    assert len(performed) == 1, "'Coalescing' test has failed!"
+    print("Test 'Coalescing' Passed", "", sep="\n")
+
+
+def test_priority():
+    """
+    Testing 'Priority'
+    """
+
+    async def operation(name: str) -> None:
+        order.append(name)
+        await sleep(0.01)
+
+    async def performing() -> None:
+        await gather(
+            radio.perform(key="first", operation=lambda: operation("first")),
+            radio.perform(key="scan", operation=lambda: operation("scan")),
+            radio.perform(
+                key="join", operation=lambda: operation("join"), priority=JOIN
+            ),
+        )
+
+    print("Testing 'Priority'")
+    order: list[str] = []
+    radio: Radio = Radio()
+    run(performing())
+    assert order == ["first", "join", "scan"], "'Priority' test has failed!"
+    assert not radio.busy, "'Priority' test has failed!"
+    print("Test 'Priority' Passed", "", sep="\n")
+
+
+try:
+    test_coalescing()
+    test_priority()
+except AssertionError as error:
+    print(f"AssertionError: {error}")
+else:
+    print("All tests passed!")
+finally:
+    print("Goodbye!")
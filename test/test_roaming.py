@@ -0,0 +1,61 @@
+from assistant import Roaming
+
+
+def test_forgetting():
+    """
+    Testing 'Forgetting' of BSSIDs missing from a scan
+    """
+    print("Testing 'Forgetting'")
+    roaming: Roaming = Roaming()
+    roaming.observe(networks=[(b"first", b"\x01", 1, -60, 3, False)])
+    roaming.observe(networks=[(b"second", b"\x02", 6, -70, 3, False)])
+    assert roaming.smoothed == {b"\x02": -70}, "'Forgetting' test has failed!"
+    print("Test 'Forgetting' Passed", "", sep="\n")
+
+
+def test_smoothing():
+    """
+    Testing 'Smoothing'
+    """
+    print("Testing 'Smoothing'")
+    roaming: Roaming = Roaming(weight=0.5)
+    for rssi in (-60, -80, -40):
+        roaming.observe(networks=[(b"network", b"\x01", 1, rssi, 3, False)])
+    strength: float = roaming.strength((b"network", b"\x01", 1, -40, 3, False))
+    assert strength == -55, "'Smoothing' test has failed!"
+    strength = roaming.strength((b"network", b"\x02", 1, -75, 3, False))
+    assert strength == -75, "'Smoothing' test has failed!"
+    print("Test 'Smoothing' Passed", "", sep="\n")
+
+
+def test_validation():
+    """
+    Testing 'Roaming' validation
+    """
+    print("Testing 'Roaming' validation")
+
+    try:
+        _: Roaming = Roaming(margin=-1)
+    except ValueError as _:
+        print(f"Caught error: {_}")
+        print("Test 1 of 2 of 'Roaming' Passed")
+
+    try:
+        _: Roaming = Roaming(weight=0)
+    except ValueError as _:
+        print(f"Caught error: {_}")
+        print("Test 2 of 2 of 'Roaming' Passed")
+
+    print("Test 'Roaming' validation Passed", "", sep="\n")
+
+
+try:
+    test_validation()
+    test_smoothing()
+    test_forgetting()
+except AssertionError as error:
+    print(f"AssertionError: {error}")
+else:
+    print("All tests passed!")
+finally:
+    print("Goodbye!")
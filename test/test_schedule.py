@@ -0,0 +1,63 @@
+from assistant import Schedule
+
+
+def test_growth():
+    """
+    Testing 'Growth'
+    """
+    print("Testing 'Growth'")
+    schedule: Schedule = Schedule(maximum=30, minimum=5)
+    intervals: list[float] = [schedule.next(rssi=-50) for _ in range(4)]
+    assert intervals == [10, 20, 30, 30], "'Growth' test has failed!"
+    print("Test 'Growth' Passed", "", sep="\n")
+
+
+def test_shrinking():
+    """
+    Testing 'Shrinking'
+    """
+    print("Testing 'Shrinking'")
+    schedule: Schedule = Schedule(maximum=40, minimum=5)
+    for _ in range(3):
+        schedule.next(rssi=-50)
+    assert schedule.next(rssi=-75) == 5, "'Shrinking' test has failed!"
+    schedule.next(rssi=-50)
+    assert schedule.next(rssi=-80) == 5, "'Shrinking' test has failed!"
+    assert schedule.next(rssi=-80) == 5, "'Shrinking' test has failed!"
+    assert schedule.next(rssi=-50) == 10, "'Shrinking' test has failed!"
+    assert schedule.next(failed=True, rssi=-50) == 5, "'Shrinking' test has failed!"
+    assert schedule.next() == 5, "'Shrinking' test has failed!"
+    print("Test 'Shrinking' Passed", "", sep="\n")
+
+
+def test_validation():
+    """
+    Testing 'Schedule' validation
+    """
+    print("Testing 'Schedule' validation")
+
+    try:
+        _: Schedule = Schedule(minimum=0)
+    except ValueError as _:
+        print(f"Caught error: {_}")
+        print("Test 1 of 2 of 'Schedule' Passed")
+
+    try:
+        _: Schedule = Schedule(maximum=5, minimum=10)
+    except ValueError as _:
+        print(f"Caught error: {_}")
+        print("Test 2 of 2 of 'Schedule' Passed")
+
+    print("Test 'Schedule' validation Passed", "", sep="\n")
+
+
+try:
+    test_validation()
+    test_growth()
+    test_shrinking()
+except AssertionError as error:
+    print(f"AssertionError: {error}")
+else:
+    print("All tests passed!")
+finally:
+    print("Goodbye!")
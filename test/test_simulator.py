@@ -0,0 +1,498 @@
+from network import STAT_CONNECTING, WLAN, AccessPoint, environment
+
+from asyncio import TimeoutError, create_task, gather, run, sleep
+from time import ticks_diff, ticks_ms
+
+from assistant import AP, Interface, Leases, Station, radio, scan, watch
+from assistant.monitor import _Monitor
+from assistant.radio import BSSID
+
+
+def test_hold():
+    """
+    Testing 'Hold'
+    """
+
+    async def holding() -> None:
+        async def disconnected(interface: Interface) -> None:
+            left.append(interface)
+
+        left: list[Interface] = []
+        good: Station = Station(password="password", ssid="good")
+        task = create_task(
+            watch(
+                disconnectedCallback=disconnected,
+                fallback=AP(password="password", ssid="fallback"),
+                pause=0.2,
+                stations=[Station(password="password", ssid="broken"), good],
+            )
+        )
+        while not good.alive:
+            await sleep(0.05)
+        connects: int = environment.connects
+        await sleep(1)
+        task.cancel()
+        await sleep(0)
+        assert good.alive, "'Hold' test has failed!"
+        assert environment.connects == connects, "'Hold' test has failed!"
+        assert not left, "'Hold' test has failed!"
+
+    print("Testing 'Hold'")
+    environment.reset(scanning=50)
+    environment.add(AccessPoint("broken", "password", association=50, failure=-1))
+    environment.add(AccessPoint("good", "password", association=50, dhcp=50))
+    run(holding())
+    print("Test 'Hold' Passed", "", sep="\n")
+
+
+def test_healthy():
+    """
+    Testing 'Healthy'
+    """
+
+    async def skipping() -> None:
+        good: Station = Station(password="password", ssid="good")
+        task = create_task(watch(interval=1, pause=0.1, stations=[good], threshold=-70))
+        while not good.alive:
+            await sleep(0.05)
+        scans: int = environment.scans
+        await sleep(0.5)
+        assert environment.scans == scans, "'Healthy' test has failed!"
+        # Scanning resumes once 'interval' seconds passed since the last scan.
+        await sleep(0.8)
+        assert environment.scans > scans, "'Healthy' test has failed!"
+        # And right away when the link weakens below 'threshold'.
+        scans = environment.scans
+        accessPoint.rssi = -80
+        await sleep(0.3)
+        task.cancel()
+        await sleep(0)
+        assert environment.scans > scans + 1, "'Healthy' test has failed!"
+        assert good.alive, "'Healthy' test has failed!"
+
+    print("Testing 'Healthy'")
+    environment.reset(scanning=20)
+    accessPoint: AccessPoint = AccessPoint(
+        "good", "password", association=50, dhcp=50, rssi=-50
+    )
+    environment.add(accessPoint)
+    run(skipping())
+    print("Test 'Healthy' Passed", "", sep="\n")
+
+
+def test_watchdog():
+    """
+    Testing 'Watchdog'
+    """
+
+    async def losing() -> None:
+        async def lost(interface: Interface, latency: int) -> None:
+            latencies.append(latency)
+
+        latencies: list[int] = []
+        good: Station = Station(password="password", ssid="good")
+        task = create_task(
+            watch(lostCallback=lost, pause=5, stations=[good], watchdog=50)
+        )
+        while not good.alive:
+            await sleep(0.05)
+        await sleep(0.2)
+        scans: int = environment.scans
+        environment.remove("good")
+        reference: int = ticks_ms()
+        # The loss cuts the pause short, so the next cycle scans long before 'pause' runs out.
+        while environment.scans == scans and ticks_diff(ticks_ms(), reference) < 1000:
+            await sleep(0.02)
+        task.cancel()
+        await sleep(0)
+        assert environment.scans > scans, "'Watchdog' test has failed!"
+        assert len(latencies) == 1, "'Watchdog' test has failed!"
+        assert 0 <= latencies[0] < 150, "'Watchdog' test has failed!"
+
+    print("Testing 'Watchdog'")
+    environment.reset(scanning=20)
+    environment.add(AccessPoint("good", "password", association=50, dhcp=50))
+    run(losing())
+    print("Test 'Watchdog' Passed", "", sep="\n")
+
+
+def test_handover():
+    """
+    Testing 'Handover'
+    """
+
+    async def handing() -> None:
+        async def connected(interface: Interface) -> None:
+            events.append(("connect", interface))
+
+        async def disconnected(interface: Interface) -> None:
+            events.append(("disconnect", interface))
+
+        events: list[tuple] = []
+        fallback: AP = AP(password="password", ssid="fallback")
+        slow: Station = Station(password="password", ssid="slow")
+        task = create_task(
+            watch(
+                connectedCallback=connected,
+                disconnectedCallback=disconnected,
+                fallback=fallback,
+                handover=True,
+                pause=0.2,
+                stations=[slow],
+            )
+        )
+        # Make before break, so the AP serves clients while the station associates.
+        served: bool = False
+        reference: int = ticks_ms()
+        while len(events) < 3 and ticks_diff(ticks_ms(), reference) < 5000:
+            served = served or (
+                fallback.alive and slow.wlan.status() == STAT_CONNECTING
+            )
+            await sleep(0.02)
+        task.cancel()
+        await sleep(0)
+        assert served, "'Handover' test has failed!"
+        assert events == [
+            ("connect", fallback),
+            ("disconnect", fallback),
+            ("connect", slow),
+        ], "'Handover' test has failed!"
+
+    print("Testing 'Handover'")
+    environment.reset(scanning=50)
+    environment.add(AccessPoint("slow", "password", association=1000, dhcp=50))
+    run(handing())
+    print("Test 'Handover' Passed", "", sep="\n")
+
+
+def test_rank():
+    """
+    Testing 'Rank'
+    """
+    print("Testing 'Rank'")
+    stations: list[Station] = [
+        Station(password="password", ssid="first"),
+        Station(password="password", ssid="second"),
+        Station(password="password", ssid="third"),
+    ]
+    index: dict[bytes, list[int]] = {b"first": [0], b"second": [1], b"third": [2]}
+    # Raw scan tuples, with the stronger BSSID of 'first' tied with 'second' and listed after it.
+    networks: list[tuple] = [
+        (b"first", b"\x01", 1, -80, 3, False),
+        (b"third", b"\x03", 11, -70, 3, False),
+        (b"second", b"\x02", 6, -50, 3, False),
+        (b"first", b"\x04", 1, -50, 3, False),
+    ]
+    # Stations tied on RSSI keep their order when roaming, as do all of them otherwise.
+    for roam in (False, True):
+        ranked: list[tuple] = _Monitor._rank(
+            index=index, networks=networks, roam=roam, stations=stations
+        )
+        assert [station for station, _ in ranked] == stations, "'Rank' test has failed!"
+        assert [network[BSSID] for _, network in ranked] == [
+            b"\x04",
+            b"\x02",
+            b"\x03",
+        ], "'Rank' test has failed!"
+    # Only the RSSI orders stations when roaming, not their position.
+    networks[1] = (b"third", b"\x03", 11, -40, 3, False)
+    ranked = _Monitor._rank(
+        index=index, networks=networks, roam=True, stations=stations
+    )
+    assert [station for station, _ in ranked] == [
+        stations[2],
+        stations[0],
+        stations[1],
+    ], "'Rank' test has failed!"
+    print("Test 'Rank' Passed", "", sep="\n")
+
+
+class Counting:
+    """
+    WLAN wrapper counting status polls
+    """
+
+    def __init__(self, wlan: WLAN) -> None:
+        self.polls: int = 0
+        self._wlan: WLAN = wlan
+
+    def __getattr__(self, name: str):
+        return getattr(self._wlan, name)
+
+    def status(self, *args) -> int:
+        self.polls += 1
+        return self._wlan.status(*args)
+
+
+def test_missed():
+    """
+    Testing 'Missed'
+    """
+
+    async def missing() -> None:
+        preferred: Station = Station(password="password", ssid="preferred")
+        task = create_task(
+            watch(
+                pause=0.2,
+                stations=[
+                    preferred,
+                    Station(password="password", ssid="weaker"),
+                ],
+            )
+        )
+        while not preferred.alive:
+            await sleep(0.05)
+        connects: int = environment.connects
+        # Hidden networks show up without their SSID, as if the scan had missed the beacon.
+        hidden.hidden = True
+        scans: int = environment.scans
+        while environment.scans < scans + 2:
+            await sleep(0.05)
+        hidden.hidden = False
+        await sleep(0.5)
+        task.cancel()
+        await sleep(0)
+        assert preferred.alive, "'Missed' test has failed!"
+        assert environment.connects == connects, "'Missed' test has failed!"
+
+    print("Testing 'Missed'")
+    environment.reset(scanning=50)
+    hidden: AccessPoint = AccessPoint("preferred", "password", association=50, dhcp=50)
+    environment.add(hidden)
+    environment.add(
+        AccessPoint("weaker", "password", association=50, dhcp=50, rssi=-80)
+    )
+    run(missing())
+    print("Test 'Missed' Passed", "", sep="\n")
+
+
+def test_roam():
+    """
+    Testing 'Roam'
+    """
+
+    async def roaming() -> None:
+        weak: Station = Station(password="password", ssid="weak")
+        strong: Station = Station(password="password", ssid="strong")
+        task = create_task(watch(pause=0.2, roam=True, stations=[weak, strong]))
+        while not weak.alive:
+            await sleep(0.05)
+        environment.add(
+            AccessPoint("strong", "password", association=50, dhcp=50, rssi=-30)
+        )
+        await sleep(1)
+        task.cancel()
+        await sleep(0)
+        assert strong.alive, "'Roam' test has failed!"
+
+    print("Testing 'Roam'")
+    environment.reset(scanning=50)
+    environment.add(AccessPoint("weak", "password", association=50, dhcp=50, rssi=-85))
+    run(roaming())
+    print("Test 'Roam' Passed", "", sep="\n")
+
+
+def test_polling():
+    """
+    Testing 'Polling'
+    """
+    print("Testing 'Polling'")
+    environment.reset()
+    environment.add(AccessPoint("network", "password", association=500, dhcp=500))
+    original: WLAN = radio.wlan(WLAN.IF_STA)
+    counting: Counting = Counting(wlan=original)
+    radio.use(interface=WLAN.IF_STA, wlan=counting)
+    try:
+        station: Station = Station(password="password", ssid="network")
+        station.pace(minimum=2, maximum=1000)
+        assert run(station.aconnect()), "'Polling' test has failed!"
+        # Polls back off while the status holds, so a 1 s join takes a few dozen of them.
+        assert counting.polls < 60, "'Polling' test has failed!"
+        station.deactivate()
+    finally:
+        radio.use(interface=WLAN.IF_STA, wlan=original)
+    print("Test 'Polling' Passed", "", sep="\n")
+
+
+def test_lease_expired():
+    """
+    Testing 'Lease Expired'
+    """
+
+    async def expiring() -> None:
+        leases: Leases = Leases()
+        leases.save(bssid=bssid, config=config, ssid="network")
+        station: Station = Station(
+            bssid=bssid, leases=leases, password="password", ssid="network"
+        )
+        assert await station.aconnect(), "'Lease Expired' test has failed!"
+        assert station.wlan.ifconfig() == config, "'Lease Expired' test has failed!"
+        station.disconnect()
+        leases.forget(ssid="network")
+        assert await station.aconnect(), "'Lease Expired' test has failed!"
+        assert station.wlan.ifconfig() != config, "'Lease Expired' test has failed!"
+
+    print("Testing 'Lease Expired'")
+    bssid: bytes = b"\x02\x00\x00\x00\x00\x09"
+    config: tuple = ("10.0.0.9", "255.0.0.0", "10.0.0.1", "10.0.0.1")
+    environment.reset()
+    environment.add(
+        AccessPoint("network", "password", association=50, bssid=bssid, dhcp=50)
+    )
+    run(expiring())
+    print("Test 'Lease Expired' Passed", "", sep="\n")
+
+
+def test_lease_foreign():
+    """
+    Testing 'Lease Foreign'
+    """
+
+    async def joining() -> None:
+        leases: Leases = Leases()
+        leases.save(bssid=first, config=config, ssid="network")
+        station: Station = Station(
+            bssid=second, leases=leases, password="password", ssid="network"
+        )
+        assert await station.aconnect(), "'Lease Foreign' test has failed!"
+        assert station.wlan.ifconfig() != config, "'Lease Foreign' test has failed!"
+        assert (
+            leases.lookup(bssid=second, ssid="network") == station.wlan.ifconfig()
+        ), "'Lease Foreign' test has failed!"
+        station.disconnect()
+
+    print("Testing 'Lease Foreign'")
+    config: tuple = ("10.0.0.9", "255.0.0.0", "10.0.0.1", "10.0.0.1")
+    first: bytes = b"\x02\x00\x00\x00\x00\x01"
+    second: bytes = b"\x02\x00\x00\x00\x00\x02"
+    environment.reset()
+    environment.add(
+        AccessPoint("network", "password", association=50, bssid=first, dhcp=50)
+    )
+    environment.add(
+        AccessPoint("network", "password", association=50, bssid=second, dhcp=50)
+    )
+    run(joining())
+    print("Test 'Lease Foreign' Passed", "", sep="\n")
+
+
+def test_retries():
+    """
+    Testing 'Retries'
+    """
+
+    async def retrying() -> None:
+        wrong: Station = Station(password="wrong", ssid="network")
+        reference: int = ticks_ms()
+        assert not await wrong.aconnect(
+            backoff=1000, retries=3
+        ), "'Retries' test has failed!"
+        # A wrong password fails fast, without backing off or retrying.
+        assert environment.connects == 1, "'Retries' test has failed!"
+        assert ticks_diff(ticks_ms(), reference) < 500, "'Retries' test has failed!"
+
+        failing: Station = Station(password="password", ssid="failing")
+        reference = ticks_ms()
+        assert not await failing.aconnect(
+            backoff=400, retries=2
+        ), "'Retries' test has failed!"
+        # Two retries wait between 200 and 400 ms, then between 400 and 800 ms.
+        elapsed: int = ticks_diff(ticks_ms(), reference)
+        assert 600 <= elapsed < 1500, "'Retries' test has failed!"
+
+        reference = ticks_ms()
+        assert not await failing.aconnect(
+            backoff=400, deadline=1, retries=10
+        ), "'Retries' test has failed!"
+        assert ticks_diff(ticks_ms(), reference) < 1300, "'Retries' test has failed!"
+
+        pinned: Station = Station(
+            bssid=b"\x00\x00\x00\x00\x00\x00", password="password", ssid="network"
+        )
+        connects: int = environment.connects
+        # A stale pin costs one more join but no retry.
+        assert await pinned.aconnect(retries=0), "'Retries' test has failed!"
+        assert environment.connects == connects + 2, "'Retries' test has failed!"
+        assert pinned.bssid is None, "'Retries' test has failed!"
+        pinned.deactivate()
+
+    print("Testing 'Retries'")
+    environment.reset()
+    environment.add(AccessPoint("failing", "password", association=50, failure=-1))
+    environment.add(AccessPoint("network", "password", association=50, dhcp=50))
+    run(retrying())
+    print("Test 'Retries' Passed", "", sep="\n")
+
+
+def test_scan_shared():
+    """
+    Testing 'Scan Shared'
+    """
+
+    async def sharing() -> None:
+        results: list[list] = await gather(scan(), scan(), scan())
+        assert environment.scans == 1, "'Scan Shared' test has failed!"
+        assert results[0] == results[1] == results[2], "'Scan Shared' test has failed!"
+        assert len(results[0]) == 1, "'Scan Shared' test has failed!"
+        # A result younger than 'age' seconds is reused without touching the radio.
+        assert await scan(age=5) == results[0], "'Scan Shared' test has failed!"
+        assert environment.scans == 1, "'Scan Shared' test has failed!"
+
+    print("Testing 'Scan Shared'")
+    environment.reset(scanning=200)
+    environment.add(AccessPoint("network", "password"))
+    run(sharing())
+    print("Test 'Scan Shared' Passed", "", sep="\n")
+
+
+def test_scan_abandoned():
+    """
+    Testing 'Scan Abandoned'
+    """
+
+    async def abandoning() -> None:
+        try:
+            _: list = await scan(timeout=0.3)
+        except TimeoutError as _:
+            print(f"Caught error: {_}")
+        assert radio.busy, "'Scan Abandoned' test has failed!"
+        _: list = await scan(timeout=5)
+        assert environment.scans == 2, "'Scan Abandoned' test has failed!"
+
+        task = create_task(scan(age=0, timeout=5))
+        await sleep(0.1)
+        task.cancel()
+        await sleep(0)
+        assert radio.busy, "'Scan Abandoned' test has failed!"
+        while radio.busy:
+            await sleep(0.05)
+        assert environment.scans == 3, "'Scan Abandoned' test has failed!"
+        assert not radio.wlan(WLAN.IF_STA).active(), "'Scan Abandoned' test has failed!"
+
+    print("Testing 'Scan Abandoned'")
+    environment.reset(scanning=1000)
+    run(abandoning())
+    print("Test 'Scan Abandoned' Passed", "", sep="\n")
+
+
+try:
+    test_hold()
+    test_missed()
+    test_healthy()
+    test_watchdog()
+    test_handover()
+    test_rank()
+    test_roam()
+    test_scan_shared()
+    test_scan_abandoned()
+    test_lease_expired()
+    test_lease_foreign()
+    test_polling()
+    test_retries()
+except AssertionError as error:
+    print(f"AssertionError: {error}")
+else:
+    print("All tests passed!")
+finally:
+    environment.reset()
+    print("Goodbye!")
@@ -0,0 +1,75 @@
+from os import listdir, remove
+
+from assistant import Store
+
+filename: str = "store.bin"
+
+
+def test_reload():
+    """
+    Testing 'Reload'
+    """
+    print("Testing 'Reload'")
+    store: Store = Store(path=filename)
+    for number in range(8):
+        store.add(password=f"password-{number}", ssid=f"ssid-{number}")
+    store.add(password="replaced", ssid="ssid-2")
+    assert store.remove(ssid="ssid-3"), "'Reload' test has failed!"
+    assert not store.remove(ssid="ssid-3"), "'Reload' test has failed!"
+    reloaded: Store = Store(path=filename)
+    assert len(reloaded) == 7, "'Reload' test has failed!"
+    assert b"ssid-3" not in reloaded, "'Reload' test has failed!"
+    assert reloaded.password(b"ssid-2") == "replaced", "'Reload' test has failed!"
+    assert reloaded.waste == store.waste > 0, "'Reload' test has failed!"
+    print("Test 'Reload' Passed", "", sep="\n")
+
+
+def test_compact():
+    """
+    Testing 'Compact'
+    """
+    print("Testing 'Compact'")
+    store: Store = Store(path=filename)
+    ssids: list[str] = store.ssids
+    store.compact()
+    assert store.waste == 0, "'Compact' test has failed!"
+    assert Store(path=filename).ssids == ssids, "'Compact' test has failed!"
+    assert store.password(b"ssid-7") == "password-7", "'Compact' test has failed!"
+    print("Test 'Compact' Passed", "", sep="\n")
+
+
+def test_validation():
+    """
+    Testing 'Store' validation
+    """
+    print("Testing 'Store' validation")
+
+    try:
+        Store(path=filename).add(password="password", ssid="")
+    except ValueError as _:
+        print(f"Caught error: {_}")
+        print("Test 1 of 2 of 'Store' Passed")
+
+    try:
+        Store(path=filename).add(password="x" * 65, ssid="ssid")
+    except ValueError as _:
+        print(f"Caught error: {_}")
+        print("Test 2 of 2 of 'Store' Passed")
+
+    print("Test 'Store' validation Passed", "", sep="\n")
+
+
+try:
+    if filename in listdir():
+        remove(filename)
+    test_validation()
+    test_reload()
+    test_compact()
+except AssertionError as error:
+    print(f"AssertionError: {error}")
+else:
+    print("All tests passed!")
+finally:
+    if filename in listdir():
+        remove(filename)
+    print("Goodbye!")
@@ -0,0 +1,135 @@
+from network import STAT_CONNECTING, STAT_GOT_IP, STAT_IDLE, WLAN
+from os import listdir, remove
+from time import sleep
+
+from assistant import Recorder, Replay, radio
+
+
+class Scripted:
+    """
+    Stand-in for a WLAN answering polls from a list, so recording needs no network
+    """
+
+    def __init__(self, statuses: list[int]) -> None:
+        self._active: bool = False
+        self._statuses: list[int] = statuses
+
+    def active(self, value: bool = None) -> bool | None:
+        if value is None:
+            return self._active
+        self._active = value
+
+    def connect(self, ssid: str = None, key: str = None, **kwargs) -> None:
+        pass
+
+    def ifconfig(self, *args) -> tuple:
+        return ("192.168.1.100", "255.255.255.0", "192.168.1.1", "192.168.1.1")
+
+    def scan(self) -> list[tuple]:
+        return [(b"network", b"\x01\x02\x03\x04\x05\x06", 6, -50, 3, False)]
+
+    def status(self, parameter: str = None) -> int:
+        return self._statuses.pop(0) if len(self._statuses) > 1 else self._statuses[0]
+
+
+filename: str = "trace.jsonl"
+
+
+def test_record():
+    """
+    Testing 'Record'
+    """
+    print("Testing 'Record'")
+    radio.use(
+        interface=WLAN.IF_STA,
+        wlan=Scripted(
+            statuses=[STAT_IDLE, STAT_CONNECTING, STAT_CONNECTING, STAT_GOT_IP]
+        ),
+    )
+    recorder: Recorder = Recorder(path=filename)
+    recorder.install()
+    wlan = radio.wlan(WLAN.IF_STA)
+    wlan.active(True)
+    _: int = wlan.status()
+    wlan.connect("network", "password")
+    _ = wlan.status()
+    _ = wlan.status()
+    sleep(0.2)
+    _ = wlan.status()
+    _: list[tuple] = wlan.scan()
+    _: tuple = wlan.ifconfig()
+    recorder.uninstall()
+
+    with open(filename) as file:
+        trace: str = file.read()
+
+    # Repeated statuses are written once, and passwords never are.
+    assert trace.count('"status"') == 3, "'Record' test has failed!"
+    assert "password" not in trace, "'Record' test has failed!"
+    print("Test 'Record' Passed", "", sep="\n")
+
+
+def test_replay():
+    """
+    Testing 'Replay'
+    """
+    print("Testing 'Replay'")
+    replay: Replay = Replay(path=filename, speed=1)
+    replay.install()
+    wlan = radio.wlan(WLAN.IF_STA)
+    wlan.active(True)
+    wlan.connect("network", "password")
+    assert wlan.status() == STAT_CONNECTING, "'Replay' test has failed!"
+    replay.uninstall()
+
+    replay = Replay(path=filename, speed=100)
+    replay.install()
+    wlan = radio.wlan(WLAN.IF_STA)
+    wlan.active(True)
+    wlan.connect("network", "password")
+    sleep(0.01)
+    assert wlan.status() == STAT_GOT_IP, "'Replay' test has failed!"
+    assert wlan.scan() == [
+        (b"network", b"\x01\x02\x03\x04\x05\x06", 6, -50, 3, False)
+    ], "'Replay' test has failed!"
+    assert wlan.ifconfig()[0] == "192.168.1.100", "'Replay' test has failed!"
+    replay.uninstall()
+    print("Test 'Replay' Passed", "", sep="\n")
+
+
+def test_validation():
+    """
+    Testing 'Recorder' and 'Replay' validation
+    """
+    print("Testing 'Recorder' and 'Replay' validation")
+
+    try:
+        _: Recorder = Recorder(batch=0)
+    except ValueError as _:
+        print(f"Caught error: {_}")
+        print("Test 1 of 2 of 'Recorder' and 'Replay' Passed")
+
+    try:
+        _: Replay = Replay(path=filename, speed=0)
+    except ValueError as _:
+        print(f"Caught error: {_}")
+        print("Test 2 of 2 of 'Recorder' and 'Replay' Passed")
+
+    print("Test 'Recorder' and 'Replay' validation Passed", "", sep="\n")
+
+
+original: WLAN = radio.wlan(WLAN.IF_STA)
+
+try:
+    test_validation()
+    test_record()
+    test_replay()
+except AssertionError as error:
+    print(f"AssertionError: {error}")
+else:
+    print("All tests passed!")
+finally:
+    radio.use(interface=WLAN.IF_STA, wlan=original)
+    if filename in listdir():
+        remove(filename)
+    print("Goodbye!")